@@ -148,6 +148,10 @@ class ConfigManager:
                 "type": bool,
                 "default": False,
                 "emptyable": False
+            },
+            "log": {
+                # Niveaux POL ignorés par module : {source_id: [niveaux]}
+                "disabled_levels": {"type": dict, "default": {}, "emptyable": True}
             }
         }
 
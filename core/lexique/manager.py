@@ -9,9 +9,12 @@ import re
 import time
 import random
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, FrozenSet
 from dataclasses import dataclass
 
+# Lié une seule fois : évite la résolution d'attribut à chaque réponse
+_choice = random.choice
+
 # ✅ DÉFINIR LexiqueAction directement ici
 @dataclass
 class LexiqueAction:
@@ -20,13 +23,14 @@ class LexiqueAction:
     cat: str
     effect: str
     questions: List[str]
-    responses: List[str]
+    responses: Tuple[str, ...]
     description: str
     ambiance_player: str = "none"
     ambiance_track: str = ""
     interact_output: str = "none"
     interact_type: str = "none"
     interact_input: str = ""
+    questions_set: FrozenSet[str] = frozenset()  # Questions normalisées (minuscules) pour test d'appartenance
 
 class SRGSGenerator:
     """Générateur de grammaires SRGS depuis le lexique avec support des règles dynamiques"""
@@ -398,6 +402,7 @@ class LexiqueManager:
     def __init__(self, lexique_path: str = "./core/config/lexique.yaml"):
         self.lexique_path = Path(lexique_path)
         self.actions: Dict[str, LexiqueAction] = {}
+        self._responses: Dict[str, Tuple[str, ...]] = {}  # action → réponses non vides
         self.global_config: Dict[str, Any] = {}
         self.categories: Dict[str, List[str]] = {}
         
@@ -466,6 +471,7 @@ class LexiqueManager:
         """Parse les données YAML et remplit les collections"""
         # Réinitialiser les collections
         self.actions.clear()
+        self._responses.clear()
         self.categories.clear()
         
         # Extraire la config globale
@@ -480,6 +486,8 @@ class LexiqueManager:
             parsed_action = self._parse_action(action_name, action_data)
             if parsed_action:
                 self.actions[action_name] = parsed_action
+                if parsed_action.responses:
+                    self._responses[action_name] = parsed_action.responses
                 
                 # Ajouter à la catégorie
                 category = parsed_action.cat
@@ -525,7 +533,8 @@ class LexiqueManager:
             
             # Nettoyer les questions/réponses (enlever les espaces)
             questions = [q.strip() for q in questions if q.strip()]
-            responses = [r.strip() for r in responses if r.strip()]
+            responses = tuple(r.strip() for r in responses if r.strip())
+            questions_set = frozenset(q.lower() for q in questions)
             
             return LexiqueAction(
                 root=root,
@@ -538,7 +547,8 @@ class LexiqueManager:
                 ambiance_track=ambiance_track,
                 interact_output=interact_output,
                 interact_type=interact_type,
-                interact_input=interact_input
+                interact_input=interact_input,
+                questions_set=questions_set
             )
             
         except Exception as e:
@@ -570,10 +580,8 @@ class LexiqueManager:
     
     def get_random_response(self, action_name: str) -> Optional[str]:
         """Récupère une réponse aléatoire pour une action"""
-        action = self.get_action(action_name)
-        if action and action.responses:
-            return random.choice(action.responses)
-        return None
+        responses = self._responses.get(action_name)
+        return _choice(responses) if responses else None
     
     def find_action_by_question(self, question: str) -> Optional[str]:
         """
@@ -588,12 +596,25 @@ class LexiqueManager:
         question_lower = question.lower().strip()
         
         for action_name, action in self.actions.items():
-            for q in action.questions:
-                if q.lower().strip() == question_lower:
-                    return action_name
+            if question_lower in action.questions_set:
+                return action_name
         
         return None
     
+    def action_has_question(self, action_name: str, question: str) -> bool:
+        """
+        Vérifie qu'une question appartient à une action (recherche exacte)
+        
+        Args:
+            action_name: Nom de l'action
+            question: Question à vérifier
+            
+        Returns:
+            bool: True si la question fait partie de l'action
+        """
+        action = self.actions.get(action_name)
+        return action is not None and question.lower().strip() in action.questions_set
+    
     def search_actions(self, query: str, category: Optional[str] = None) -> List[str]:
         """
         Recherche d'actions par mots-clés
@@ -705,4 +726,8 @@ def get_random_response(action_name: str) -> Optional[str]:
 
 def find_action_by_question(question: str) -> Optional[str]:
     """Interface simplifiée pour trouver une action par question"""
-    return get_lexique_manager().find_action_by_question(question)
\ No newline at end of file
+    return get_lexique_manager().find_action_by_question(question)
+
+def action_has_question(action_name: str, question: str) -> bool:
+    """Interface simplifiée pour vérifier qu'une question appartient à une action"""
+    return get_lexique_manager().action_has_question(action_name, question)
\ No newline at end of file
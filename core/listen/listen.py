@@ -3,12 +3,64 @@ Module de reconnaissance vocale - Version Python
 Remplace le module listen.js Node.js
 """
 
-import subprocess
+import asyncio
+import os
+import queue
+import re
 import threading
 import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Tuple
 from core.bus import EventBus, Message
+from core.pol import create_pol
+pol = create_pol(source_id=4)
+
+# orjson (optionnel) parse directement des bytes, bien plus vite que json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Taille max de la file de publication
+_PUBLISH_QUEUE_MAX = 1024
+
+# Nombre max de messages publiés d'un coup par le thread de publication
+_PUBLISH_BATCH = 32
+
+# Longueur max d'une ligne stderr en attente de son saut de ligne
+_STDERR_LINE_MAX = 1 << 20
+
+# Balises encadrant chaque résultat JSON sur stdout
+_JSON_START = b'<JSON>'
+_JSON_END = b'</JSON>'
+
+# Taille de lecture de stderr, et limite du StreamReader asyncio : au-delà de
+# 2 x limite non consommés, le transport suspend la lecture du pipe ; c'est
+# aussi la taille max d'une trame JSON
+_READ_CHUNK = 1 << 16
+_STREAM_LIMIT = 1 << 18
+
+# Extraction de la confiance des hypothèses (comme dans le JS), compilées une fois
+_RE_HYPOTH_CONF = re.compile(r'=>\s([\d,]+)')
+_RE_HYPOTH_INFO = re.compile(r'recognizer_SpeechHypothesized(.*?)=>')
+
+# Lignes stderr publiées en "debug" sur le bus / mises en avant à l'affichage
+_RE_DEBUG_PUBLISH = re.compile(r'SpeechRecognized|recognizer_SpeechHypothesized')
+_RE_LOG_HIGHLIGHT = re.compile(r'Init recognizer|Start listening\.\.\.|Loading grammar cache')
+
+
+@dataclass(slots=True)
+class ListenState:
+    """État d'un processus listen.exe : un seul objet par listen_id"""
+    listen_id: str
+    options: MappingProxyType  # Options figées au start(), partagées par référence
+    running: threading.Event = field(default_factory=threading.Event)
+    process: Optional[asyncio.subprocess.Process] = None
+    tasks: Tuple[asyncio.Task, ...] = ()
+    stderr_buffer: bytearray = field(default_factory=bytearray)  # Ligne stderr incomplète en attente
 
 
 class ListenManager:
@@ -18,12 +70,28 @@ class ListenManager:
 
     def __init__(self, event_bus: EventBus, DEBUG: bool = False):
         self.event_bus = event_bus
-        self.processes: Dict[str, subprocess.Popen] = {}
-        self.threads: Dict[str, threading.Thread] = {}
-        self.buffers: Dict[str, str] = {}
-        self.running: Dict[str, bool] = {}
+        self._state: Dict[str, ListenState] = {}
         self.DEBUG = DEBUG
         
+        # Boucle asyncio unique : un seul thread lit les pipes de tous les processus
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        
+        # Protège self._state (jamais tenu pendant un wait)
+        self._state_lock = threading.Lock()
+        
+        # File de publication : la boucle I/O dépose, un thread dédié publie sur le bus
+        # (bornée : si les abonnés ne suivent plus, les événements en trop sont abandonnés)
+        self._pub_q: queue.Queue = queue.Queue(maxsize=_PUBLISH_QUEUE_MAX)
+        self._pub_overflow = False
+        self._pub_thread = threading.Thread(
+            target=self._publish_loop,
+            daemon=True,
+            name="ListenPublish"
+        )
+        self._pub_thread.start()
+        
         # Chemin vers l'exécutable
         self.listen_exe = Path(__file__).parent.parent / "exe" / "listen" / "listen.exe"
         
@@ -46,9 +114,21 @@ class ListenManager:
             "Culture: fr-FR Kinect",
             "Culture: en-US Kinect",
         ]
+        # Filtre compilé en une seule alternance, appliqué aux bytes bruts de stderr
+        # (avant tout décodage UTF-8)
+        self._excluded_re = re.compile(
+            b'|'.join(re.escape(m.encode('utf-8')) for m in self.excluded_messages)
+        )
+        # Raccourci : la plupart des lignes de bruit commencent par l'événement lui-même
+        # (un seul mot), un test d'appartenance suffit alors avant la regex
+        self._excluded_tokens = frozenset(
+            m.encode('utf-8') for m in self.excluded_messages
+            if ' ' not in m and not m.endswith('.') and ':' not in m
+        )
         
     def start(self, listen_id: str, options: Dict[str, Any]) -> bool:
         """Démarre un processus listen.exe avec l'ID spécifié"""
+        state = None
         try:
             # Arrêter le processus existant s'il y en a un
             self.stop(listen_id)
@@ -73,70 +153,49 @@ class ListenManager:
                 args.append('--hotword=' + options['Hotword'])
             #afficher la ligne de commande complète en mode debug
             if self.DEBUG:
-                print(f"@@@ Command Line: {' '.join(args)}")        
-            # Lancer le processus
-            process = subprocess.Popen(
-                args,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.PIPE,
-                text=False,  # Mode binaire pour éviter les problèmes d'encodage
-                bufsize=0
-            )
+                pol.write(4, f"@@@ Command Line: {' '.join(args)}", "log+print")
             
-            self.processes[listen_id] = process
-            self.running[listen_id] = True
-            self.buffers[listen_id] = ""
+            state = ListenState(listen_id, MappingProxyType(dict(options)))
+            state.running.set()
+            with self._state_lock:
+                self._state[listen_id] = state
             
-            if self.DEBUG:
-                print(f"@@@ Starting Process {listen_id} {process.pid}")
+            # Lancer le processus dans la boucle asyncio (les pipes y sont lus par des tâches)
+            process, tasks = self._run_in_loop(self._spawn(state, args), timeout=10)
+            with self._state_lock:
+                superseded = self._state.get(listen_id) is not state
+                if not superseded:
+                    state.process = process
+                    state.tasks = tasks
+            if superseded:
+                # stop() ou un autre start() est passé pendant le lancement
+                self._run_in_loop(self._shutdown(listen_id, process, tasks), timeout=10)
+                return False
             
-            # Créer les threads pour lire stdout et stderr
-            stdout_thread = threading.Thread(
-                target=self._read_stdout, 
-                args=(listen_id, process, options),
-                daemon=True
-            )
-            stderr_thread = threading.Thread(
-                target=self._read_stderr,
-                args=(listen_id, process),
-                daemon=True
-            )
+            pol.write(1, f"@@@ Starting Process {listen_id} {process.pid}", "log+print" if self.DEBUG else "log")
             
-            stdout_thread.start()
-            stderr_thread.start()
-            
-            self.threads[listen_id + "_stdout"] = stdout_thread
-            self.threads[listen_id + "_stderr"] = stderr_thread
-            
-            self._publish_event(listen_id, "started", {"pid": process.pid, "options": options})
+            self._publish_event(listen_id, "started", {"pid": process.pid, "options": state.options})
             
             return True
             
         except Exception as e:
+            with self._state_lock:
+                if state is not None and self._state.get(listen_id) is state:
+                    del self._state[listen_id]
             self._publish_error(listen_id, f"Erreur démarrage: {str(e)}")
             return False
 
     def stop(self, listen_id: str) -> bool:
         """Arrête le processus spécifié"""
         try:
-            self.running[listen_id] = False
+            # Retirer l'état du listener, l'arrêt du processus se fait hors verrou
+            with self._state_lock:
+                state = self._state.pop(listen_id, None)
             
-            if listen_id in self.processes:
-                process = self.processes[listen_id]
-                if process and process.poll() is None:
-                    process.terminate()
-                    process.wait(timeout=5)
-                    if self.DEBUG:
-                        print(f"@@@ Killing [{listen_id}] PID: {process.pid}")
-                        
-                del self.processes[listen_id]
-                
-            # Nettoyer les buffers et threads
-            if listen_id in self.buffers:
-                del self.buffers[listen_id]
-                
-            # Les threads daemon se termineront automatiquement
+            if state is not None:
+                state.running.clear()
+                if state.process is not None:
+                    self._run_in_loop(self._shutdown(listen_id, state.process, state.tasks), timeout=10)
             
             self._publish_event(listen_id, "stopped")
             return True
@@ -150,93 +209,178 @@ class ListenManager:
         self.stop(listen_id)
         return self.start(listen_id, options)
 
+    def get_options(self, listen_id: str) -> Optional[MappingProxyType]:
+        """Retourne les options (lecture seule) avec lesquelles le processus a été démarré"""
+        state = self._state.get(listen_id)
+        return state.options if state is not None else None
+
     def stop_all(self):
         """Arrête tous les processus"""
-        for listen_id in list(self.processes.keys()):
+        for listen_id in list(self._state.keys()):
             self.stop(listen_id)
 
-    def _read_stdout(self, listen_id: str, process: subprocess.Popen, options: Dict[str, Any]):
-        """Lit stdout en continu et extrait les JSON (comme handleBuffer dans le JS)"""
-        try:
-            while self.running.get(listen_id, False) and process.poll() is None:
-                data = process.stdout.read(1024)  # Lire par chunks
-                if data:
-                    decoded_data = data.decode('utf-8', errors='ignore')
-                    self._handle_buffer(listen_id, decoded_data, options)
-                        
-        except Exception as e:
-            if self.running.get(listen_id, False):
-                self._publish_error(listen_id, f"Erreur lecture stdout: {str(e)}")
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Crée la boucle asyncio et son thread au premier démarrage"""
+        with self._loop_lock:
+            if self._loop is None:
+                # Sous Windows, seule la ProactorEventLoop gère les pipes de sous-processus
+                # (on ne dépend pas de la policy globale, qu'une lib tierce peut avoir changée)
+                loop = asyncio.ProactorEventLoop() if os.name == "nt" else asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=loop.run_forever,
+                    daemon=True,
+                    name="ListenIO"
+                )
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
 
-    def _read_stderr(self, listen_id: str, process: subprocess.Popen):
-        """Lit stderr en continu pour le logging"""
-        try:
-            while self.running.get(listen_id, False) and process.poll() is None:
-                data = process.stderr.read(1024)
-                if data:
-                    decoded_data = data.decode('utf-8', errors='ignore')
-                    self._handle_stderr_data(listen_id, decoded_data)
-                        
-        except Exception as e:
-            if self.running.get(listen_id, False):
-                self._publish_error(listen_id, f"Erreur lecture stderr: {str(e)}")
+    def _run_in_loop(self, coro, timeout: float):
+        """Exécute une coroutine dans la boucle I/O et attend son résultat"""
+        if threading.current_thread() is self._loop_thread:
+            # Appel depuis un abonné du bus (donc depuis la boucle) : attendre bloquerait la boucle
+            coro.close()
+            raise RuntimeError("appel bloquant impossible depuis la boucle I/O")
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=timeout)
 
-    def _handle_buffer(self, listen_id: str, data: str, options: Dict[str, Any]):
-        """Traite le buffer et extrait les JSON (équivalent de handleBuffer du JS)"""
-        
-        # Ajouter au buffer
-        if listen_id not in self.buffers:
-            self.buffers[listen_id] = ""
+    async def _spawn(self, state: ListenState, args: list):
+        """Lance listen.exe et démarre les tâches de lecture stdout/stderr"""
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.PIPE,
+            limit=_STREAM_LIMIT
+        )
+        tasks = (
+            asyncio.ensure_future(self._pump_frames(process.stdout, state)),
+            asyncio.ensure_future(self._pump_stderr(process.stderr, state)),
+        )
+        return process, tasks
+
+    async def _shutdown(self, listen_id: str, process: asyncio.subprocess.Process, tasks):
+        """Annule les tâches de lecture et termine le processus"""
+        for task in tasks:
+            task.cancel()
+        if process.returncode is None:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout=5)
+            pol.write(1, f"@@@ Killing [{listen_id}] PID: {process.pid}", "log+print" if self.DEBUG else "log")
+
+    async def _pump_frames(self, stream: asyncio.StreamReader, state: ListenState):
+        """Lit stdout trame par trame (équivalent de handleBuffer du JS)"""
+        listen_id, running, options = state.listen_id, state.running, state.options
+        put = self._enqueue
+        while True:
+            try:
+                # La recherche de </JSON> se fait dans le buffer du StreamReader
+                chunk = await stream.readuntil(_JSON_END)
+            except asyncio.IncompleteReadError:
+                return  # EOF : une trame incomplète éventuelle est abandonnée
+            except asyncio.LimitOverrunError as e:
+                # Pas de fin de trame dans la limite : on jette, la fin orpheline le sera aussi
+                await stream.read(e.consumed)
+                continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if running.is_set():
+                    self._publish_error(listen_id, f"Erreur lecture stdout: {str(e)}")
+                return
             
-        self.buffers[listen_id] += data
-        buffer = self.buffers[listen_id]
-        
-        # Chercher les balises JSON (exactement comme dans le JS)
-        end_pos = buffer.find('</JSON>')
-        if end_pos < 0:
-            return
+            if not running.is_set():
+                return  # Arrêt demandé
             
-        start_pos = buffer.find('<JSON>')
-        if start_pos < 0:
-            return
+            # Le bruit avant <JSON> est ignoré, une fin de trame orpheline aussi
+            start_pos = chunk.find(_JSON_START)
+            if start_pos < 0:
+                continue
             
-        # Extraire le JSON
-        json_str = buffer[start_pos + 6:end_pos]
-        self.buffers[listen_id] = buffer[end_pos + 7:]
-        
-        try:
-            json_data = json.loads(json_str)
+            # Le décodage JSON se fait côté thread de publication : la boucle I/O ne fait que lire
+            put((listen_id, chunk[start_pos + 6:-7], options))
+
+    async def _pump_stderr(self, stream: asyncio.StreamReader, state: ListenState):
+        """Lit stderr en continu pour le logging"""
+        listen_id, running = state.listen_id, state.running
+        while True:
+            try:
+                data = await stream.read(_READ_CHUNK)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if running.is_set():
+                    self._publish_error(listen_id, f"Erreur lecture stderr: {str(e)}")
+                return
             
-            if self.DEBUG:
-                print(f"[JSON REÇU] {json_data}")
+            if not data or not running.is_set():
+                return  # EOF (le processus a fermé ce pipe) ou arrêt demandé
             
-            # Publier sur le bus (équivalent du callback dans le JS)
-            self._publish_event(listen_id, "recognition", {
+            try:
+                self._handle_stderr_data(state, data)
+            except Exception as e:
+                self._publish_error(listen_id, f"Erreur traitement stderr: {str(e)}")
+
+    def _frame_to_message(self, listen_id: str, json_bytes: bytes, options: MappingProxyType) -> Optional[Message]:
+        """Décode une trame JSON en message "recognition" (None si la trame est invalide)"""
+        try:
+            json_data = _json_loads(json_bytes)
+        except ValueError as e:  # JSONDecodeError (json/orjson) ou UTF-8 invalide
+            pol.write(2, f'Parsing Error: {e}, json: {json_bytes.decode("utf-8", errors="replace")}',
+                      "log+print" if self.DEBUG else "log")
+            return None
+            
+        if self.DEBUG:
+            print(f"[JSON REÇU] {json_data}")
+        
+        # Équivalent du callback dans le JS
+        return {
+            "name": f"listen.{listen_id}",
+            "state": "recognition",
+            "payload": {
                 "data": json_data,
                 "options": options
-            })
-            
-        except json.JSONDecodeError as e:
-            print(f'Parsing Error: {e}, json: {json_str}')
+            }
+        }
 
-    def _handle_stderr_data(self, listen_id: str, data: str):
+    def _handle_stderr_data(self, state: ListenState, data: bytes):
         """Traite les données stderr avec filtrage (équivalent de stdErr du JS)"""
         
-        lines = data.strip().split('\n')
+        # Hors DEBUG, stderr n'est ni affiché ni publié : le pipe est juste vidé
+        if not self.DEBUG:
+            return
         
-        for line in lines:
-            if not line.strip():
+        # Une lecture peut couper une ligne : on ne traite que les lignes complètes
+        # et on garde la fin partielle pour la prochaine lecture
+        buffer = state.stderr_buffer
+        # Le reste en attente ne contient aucun saut de ligne : seules les nouvelles données sont scannées
+        scan_from = len(buffer)
+        buffer += data
+        newline_pos = buffer.rfind(b'\n', scan_from)
+        if newline_pos < 0:
+            if len(buffer) > _STDERR_LINE_MAX:
+                del buffer[:]  # Ligne sans fin : on abandonne plutôt que de grossir sans limite
+            return
+        block = bytes(buffer[:newline_pos])
+        del buffer[:newline_pos + 1]
+        
+        for raw_line in block.split(b'\n'):
+            if not raw_line.strip():
                 continue
                 
-            # Vérifier si la ligne doit être exclue (exactement comme dans le JS)
-            should_exclude = any(excluded in line for excluded in self.excluded_messages)
+            # Vérifier si la ligne doit être exclue (exactement comme dans le JS),
+            # sur les bytes bruts : les lignes de bruit ne sont jamais décodées
+            tokens = raw_line.split(None, 1)
+            should_exclude = (tokens[0] in self._excluded_tokens
+                              or self._excluded_re.search(raw_line) is not None)
             
             if not should_exclude:
+                line = raw_line.decode('utf-8', errors='ignore')
                 self._log_colored_message(line)
                 
-                # Publier les messages importants sur le bus SEULEMENT si DEBUG=True
-                if self.DEBUG and any(keyword in line for keyword in ["SpeechRecognized", "recognizer_SpeechHypothesized"]):
-                    self._publish_event(listen_id, "debug", {"message": line.strip()})
+                # Publier les messages importants sur le bus (DEBUG=True uniquement)
+                if _RE_DEBUG_PUBLISH.search(line):
+                    self._publish_event(state.listen_id, "debug", {"message": line.strip()})
 
     def _log_colored_message(self, text: str):
         """Affichage coloré des logs (simplifié par rapport au JS)"""
@@ -252,9 +396,8 @@ class ListenManager:
                 
             if "recognizer_SpeechHypothesized" in line:
                 # Extraction de la confiance comme dans le JS
-                import re
-                match = re.search(r'=>\s([\d,]+)', line)
-                info_match = re.search(r'recognizer_SpeechHypothesized(.*?)=>', line)
+                match = _RE_HYPOTH_CONF.search(line)
+                info_match = _RE_HYPOTH_INFO.search(line)
                 
                 if match and info_match:
                     info = info_match.group(1)
@@ -266,7 +409,7 @@ class ListenManager:
                             print(f"    {len(words)} mots consécutifs détectés")
                             print(f"    {line.strip()}")
                             
-            elif any(keyword in line for keyword in ["Init recognizer", "Start listening...", "Loading grammar cache"]):
+            elif _RE_LOG_HIGHLIGHT.search(line):
                 print(f"    {line.strip()}")
             elif "SpeechRecognized" in line:
                 print(f"            {line.strip()}")
@@ -274,7 +417,7 @@ class ListenManager:
                 print(f"        {line.strip()}")
 
     def _publish_event(self, listen_id: str, state: str, payload: Dict[str, Any] = None):
-        """Publie un événement sur le bus"""
+        """Dépose un événement dans la file de publication (non bloquant)"""
         if payload is None:
             payload = {}
         
@@ -284,7 +427,48 @@ class ListenManager:
             "state": state,                 # État (started, stopped, recognition, etc.)
             "payload": payload              # Données
         }
-        self.event_bus.publish(message)
+        self._enqueue(message)
+
+    def _enqueue(self, item):
+        """Dépose dans la file de publication sans jamais bloquer l'appelant"""
+        try:
+            self._pub_q.put_nowait(item)
+        except queue.Full:
+            # Un seul avertissement par épisode de saturation
+            if not self._pub_overflow:
+                self._pub_overflow = True
+                pol.write(2, f"⚠️ File de publication pleine ({_PUBLISH_QUEUE_MAX}), événements ignorés", "log+print")
+
+    def _publish_loop(self):
+        """Vide la file de publication par lots et publie sur le bus
+
+        La file contient des messages prêts (dict) et des trames JSON brutes
+        (tuple listen_id, bytes, options) décodées ici, hors de la boucle I/O.
+        """
+        get = self._pub_q.get
+        get_nowait = self._pub_q.get_nowait
+        while True:
+            if self._pub_overflow and self._pub_q.empty():
+                self._pub_overflow = False  # Saturation résorbée
+            batch = [get()]
+            while len(batch) < _PUBLISH_BATCH:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+            
+            for item in batch:
+                try:
+                    if isinstance(item, tuple):
+                        message = self._frame_to_message(*item)
+                        if message is None:
+                            continue
+                    else:
+                        message = item
+                    self.event_bus.publish(message)
+                except Exception as e:
+                    # Un abonné défaillant ne doit pas arrêter la publication
+                    pol.write(3, f"❌ Erreur publication: {e}", "log+print")
 
     def _publish_error(self, listen_id: str, error_msg: str):
         """Publie une erreur sur le bus"""
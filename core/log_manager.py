@@ -7,6 +7,7 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
+from core.pol import close_log_files
 
 
 def rotate_log_on_startup(log_file_path="logs/orion.log"):
@@ -27,6 +28,14 @@ def rotate_log_on_startup(log_file_path="logs/orion.log"):
             print(f"🔄 Aucune rotation nécessaire - fichier inexistant ou vide")
             return False
         
+        # Session créée par init_new_session : le log courant est un lien physique
+        # vers son archive, il suffit de retirer le lien (aucune relecture)
+        if log_path.stat().st_nlink > 1:
+            os.remove(log_path)
+            print(f"🔄 Session précédente déjà archivée")
+            return True
+        
+        # Ancien format (fichier simple) : la date est lue dans la première ligne
         # Lire la première ligne pour extraire la date
         with open(log_path, 'r', encoding='utf-8') as f:
             first_line = f.readline().strip()
@@ -92,13 +101,32 @@ def init_new_session(log_file_path="logs/orion.log"):
         # S'assurer que le répertoire existe
         ensure_log_directory(log_file_path)
         
+        # Libérer le fichier courant (POL le garde ouvert) avant rotation
+        close_log_files()
+        
         # Effectuer la rotation si nécessaire
         rotate_log_on_startup(log_file_path)
         
-        # Créer/vider le fichier pour la nouvelle session
-        with open(log_file_path, 'w', encoding='utf-8') as f:
-            session_start = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            f.write(f"=== SESSION DÉMARRÉE {session_start} ===\n")
+        session_start = datetime.now()
+        header = f"=== SESSION DÉMARRÉE {session_start.strftime('%Y-%m-%d %H:%M:%S')} ===\n"
+        
+        # Créer directement l'archive de la session, le log courant en est un lien physique :
+        # la rotation du prochain démarrage n'aura qu'à retirer le lien
+        log_path = Path(log_file_path)
+        archive_path = log_path.parent / f"session_{session_start.strftime('%Y-%m-%d_%H-%M-%S')}.log"
+        try:
+            with open(archive_path, 'x', encoding='utf-8') as f:
+                f.write(header)
+            try:
+                os.link(archive_path, log_path)
+            except OSError:
+                os.remove(archive_path)
+                raise
+        except OSError:
+            # Lien impossible (système de fichiers, archive déjà présente...) : fichier simple,
+            # archivé au prochain démarrage en relisant sa première ligne
+            with open(log_file_path, 'w', encoding='utf-8') as f:
+                f.write(header)
         
         print(f"🚀 Nouvelle session de log initialisée: {log_file_path}")
         return True
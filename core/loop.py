@@ -1,7 +1,11 @@
+import os
 import time
 from core.config import CONFIG
 from core import services
 
+# Marge finale attendue en boucle active plutôt qu'en sleep (précision du timer OS)
+_SPIN_MARGIN = 0.002
+
 class GameLoop:
     def __init__(self, target_fps: int | None = None):
         self.target_fps = target_fps or CONFIG.target_fps
@@ -11,25 +15,57 @@ class GameLoop:
     def start(self):
         print(f"[LOOP] Démarre à {self.target_fps} FPS (spf={self._spf:.4f}s)")
         self._running = True
-        last = time.perf_counter()
+        # Windows : timer système à 1 ms au lieu de 15,6 ms pendant la loop
+        winmm = None
+        if os.name == "nt":
+            import ctypes
+            winmm = ctypes.windll.winmm
+            winmm.timeBeginPeriod(1)
+        try:
+            self._run()
+        finally:
+            if winmm is not None:
+                winmm.timeEndPeriod(1)
+
+    def _run(self):
+        # Fonctions liées une fois : pas de lookup d'attribut de module à chaque tick
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+        poll_inputs = services.poll_inputs
+        update_game_state = services.update_game_state
+        render_frame = services.render_frame
+        spf = self._spf
+        last = perf_counter()
+        deadline = last + spf
+        # Trace des services échantillonnée : 1 tick par seconde
+        log_every = max(1, int(self.target_fps))
+        tick = 0
 
         while self._running:
-            now = time.perf_counter()
+            now = perf_counter()
             dt = now - last
             last = now
+            tick += 1
+            trace = tick % log_every == 0
 
             # --- Phase "update" (CPU logique)
-            services.poll_inputs()
-            services.update_game_state(dt)
+            poll_inputs(trace)
+            update_game_state(dt, trace)
 
             # --- Phase "render/log"
-            services.render_frame()
+            render_frame(trace)
 
-            # --- Throttle: dort le temps nécessaire pour tenir la cadence
-            elapsed = time.perf_counter() - now
-            sleep_time = self._spf - elapsed
+            # --- Throttle: échéance absolue (pas de dérive), sleep puis attente active
+            sleep_time = deadline - perf_counter() - _SPIN_MARGIN
             if sleep_time > 0:
-                time.sleep(sleep_time)
+                sleep(sleep_time)
+            while perf_counter() < deadline:
+                pass
+            
+            deadline += spf
+            if deadline < perf_counter():
+                # Trop de retard : on repart de maintenant au lieu d'enchaîner les ticks
+                deadline = perf_counter() + spf
 
     def stop(self):
         self._running = False
@@ -40,13 +40,133 @@ pol.write(5, "=== DÉBUT INITIALISATION AUDIO ===", "log+print")
 
 NOTE : MUET n'existe pas comme niveau d'écriture !
 MUET sera un filtre dans l'interface pour masquer/afficher les logs
+
+NIVEAUX DÉSACTIVÉS (chemins chauds) :
+Config "log.disabled_levels" ({source_id: [niveaux]}), appliquée au démarrage par
+set_disabled_levels() : ex. {51: [1]} coupe les traces par job du FX Generator
+if pol.enabled(1):                   # Évite de formater un message qui serait jeté
+    pol.write(1, f"Valeur x={x}")
 =====================================================
 """
 
 import os
-from datetime import datetime
+import atexit
+from collections import deque
 from pathlib import Path
 import threading
+import time
+
+
+# Intervalle entre deux écritures groupées dans les fichiers log (secondes)
+FLUSH_INTERVAL = 0.05
+
+# Niveaux désactivés par source_id (config) et loggers créés, pour appliquer la config
+# aussi aux loggers instanciés à l'import des modules, avant son chargement
+_disabled_by_source = {}
+_loggers = []
+_loggers_lock = threading.Lock()
+
+
+class _LogWriter:
+    """
+    Écrivain partagé par fichier log : le fichier est ouvert une seule fois
+    et les lignes sont écrites par lots par le thread de flush
+    """
+    
+    def __init__(self, log_file_path):
+        self.log_file_path = log_file_path
+        self._queue = deque()           # append/popleft sont thread-safe
+        self._lock = threading.Lock()   # Sérialise flush/close
+        self._fh = None                 # Ouvert à la première écriture
+    
+    def append(self, line):
+        self._queue.append(line)
+    
+    def flush(self):
+        """Écrit toutes les lignes en attente en un seul appel"""
+        with self._lock:
+            if not self._queue:
+                return
+            popleft = self._queue.popleft
+            lines = [popleft() for _ in range(len(self._queue))]
+            try:
+                if self._fh is None:
+                    # S'assurer que le répertoire existe
+                    Path(self.log_file_path).parent.mkdir(parents=True, exist_ok=True)
+                    self._fh = open(self.log_file_path, 'a', encoding='utf-8', buffering=1 << 16)
+                self._fh.writelines(lines)
+                self._fh.flush()
+            except Exception as e:
+                print(f"❌ Erreur écriture log: {e}")
+    
+    def close(self):
+        """Vide la file et ferme le fichier (il sera rouvert à la prochaine écriture)"""
+        self.flush()
+        with self._lock:
+            if self._fh is not None:
+                try:
+                    self._fh.close()
+                finally:
+                    self._fh = None
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+_flush_thread = None
+
+
+def _get_writer(log_file_path):
+    """Retourne l'écrivain partagé du fichier (un seul par chemin)"""
+    global _flush_thread
+    key = os.path.abspath(log_file_path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = _LogWriter(log_file_path)
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(target=_flush_loop, daemon=True, name="POLFlush")
+            _flush_thread.start()
+        return writer
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        flush_log_files()
+
+
+def flush_log_files():
+    """Écrit immédiatement toutes les lignes en attente"""
+    for writer in list(_writers.values()):
+        writer.flush()
+
+
+def close_log_files():
+    """
+    Vide et ferme tous les fichiers log ouverts (à appeler avant de
+    renommer/recréer un fichier log, ex: rotation de session)
+    """
+    for writer in list(_writers.values()):
+        writer.close()
+
+
+# Horodatage formaté de la seconde courante : (seconde, texte), remplacé d'un bloc
+_ts_cache = (0, "")
+
+
+def _timestamp():
+    """Horodatage "%Y-%m-%d %H:%M:%S", reformaté seulement quand la seconde change"""
+    global _ts_cache
+    now = int(time.time())
+    sec, text = _ts_cache
+    if now != sec:
+        text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _ts_cache = (now, text)
+    return text
+
+
+# Ne pas perdre les dernières lignes à la fermeture (le thread de flush est daemon)
+atexit.register(flush_log_files)
 
 
 class POLLogger:
@@ -55,7 +175,7 @@ class POLLogger:
     def __init__(self, source_id, log_file_path="logs/orion.log"):
         self.source_id = source_id
         self.log_file_path = log_file_path
-        self._lock = threading.Lock()  # Thread-safe pour écriture
+        self._writer = _get_writer(log_file_path)  # Partagé entre tous les modules
         
         # Niveaux disponibles (MUET retiré - c'est un filtre d'affichage interface)
         self.LEVELS = {
@@ -67,7 +187,20 @@ class POLLogger:
         }
         
         # Modes disponibles
-        self.MODES = ["log", "log+print"]
+        self.MODES = frozenset(["log", "log+print"])
+        
+        # Niveaux ignorés à l'écriture pour ce module (aucun par défaut, voir set_disabled_levels)
+        with _loggers_lock:
+            self.disabled_levels = set(_disabled_by_source.get(source_id, ()))
+            _loggers.append(self)
+        
+        # Gabarits précalculés par niveau : (horodatage, message) pour le fichier, message pour la console
+        self._file_tmpl = {lvl: f"[{lvl}][{source_id:02d}][%s]%s\n" for lvl in self.LEVELS}
+        self._console_tmpl = {lvl: f"[{name}][{source_id:02d}] %s" for lvl, name in self.LEVELS.items()}
+    
+    def enabled(self, level):
+        """True si un write() de ce niveau sera effectivement écrit"""
+        return level not in self.disabled_levels
     
     def write(self, level, message, mode="log"):
         """
@@ -78,52 +211,54 @@ class POLLogger:
             message (str): Message à logger
             mode (str): "log" ou "log+print"
         """
+        if level in self.disabled_levels:
+            return
+        
         try:
             # Validation des paramètres
-            if level not in self.LEVELS:
+            file_tmpl = self._file_tmpl.get(level)
+            if file_tmpl is None:
                 print(f"⚠️ POL: Niveau invalide {level}, utilisation du niveau 1 (LEGER)")
                 level = 1
+                file_tmpl = self._file_tmpl[1]
                 
             if mode not in self.MODES:
                 print(f"⚠️ POL: Mode invalide '{mode}', utilisation du mode 'log'")
                 mode = "log"
                 
-            # Créer la ligne de log
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_line = f"[{level}][{self.source_id:02d}][{timestamp}]{message}"
-            
-            # Écrire dans le fichier log
-            self._write_to_file(log_line)
+            # Créer la ligne et la mettre en file pour le fichier log (écrite par le thread de flush)
+            self._writer.append(file_tmpl % (_timestamp(), message))
             
             # Afficher sur console si demandé
             if mode == "log+print":
-                level_name = self.LEVELS[level]
-                print(f"[{level_name}][{self.source_id:02d}] {message}")
+                print(self._console_tmpl[level] % message)
                 
         except Exception as e:
             # Fallback en cas d'erreur POL
             print(f"❌ Erreur POL: {e}")
             print(f"🔄 Message original: {message}")
+
+
+def set_disabled_levels(levels_by_source):
+    """
+    Désactive des niveaux par module, pour les loggers existants et à venir
     
-    def _write_to_file(self, log_line):
-        """
-        Écrit une ligne dans le fichier log de façon thread-safe
-        
-        Args:
-            log_line (str): Ligne formatée à écrire
-        """
+    Args:
+        levels_by_source (dict): {source_id: [niveaux]} (config "log.disabled_levels"),
+                                 les sources absentes retrouvent tous leurs niveaux
+    """
+    disabled = {}
+    for source_id, levels in (levels_by_source or {}).items():
         try:
-            with self._lock:
-                # S'assurer que le répertoire existe
-                log_path = Path(self.log_file_path)
-                log_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Écrire la ligne
-                with open(self.log_file_path, 'a', encoding='utf-8') as f:
-                    f.write(log_line + '\n')
-                    
-        except Exception as e:
-            print(f"❌ Erreur écriture log: {e}")
+            disabled[int(source_id)] = frozenset(int(level) for level in (levels or ()))
+        except (TypeError, ValueError):
+            print(f"⚠️ POL: niveaux désactivés invalides pour la source {source_id}: {levels}")
+    
+    global _disabled_by_source
+    with _loggers_lock:
+        _disabled_by_source = disabled
+        for logger in _loggers:
+            logger.disabled_levels = set(disabled.get(logger.source_id, ()))
 
 
 def create_pol(source_id, log_file_path="logs/orion.log"):
@@ -1,17 +1,26 @@
+from core.pol import create_pol
+pol = create_pol(source_id=5)
+
 def init_audio():
     print("[SERVICES] init_audio() : OK (factice)")
 
 def init_network():
     print("[SERVICES] init_network() : OK (factice)")
 
-def poll_inputs():
+# Les fonctions ci-dessous sont appelées à chaque tick de la GameLoop :
+# pas de print ici, seulement du log PARANO (la loop échantillonne 1 tick/seconde)
+
+def poll_inputs(trace: bool = False):
     # Ici tu lirais clavier/souris/manette… On simule :
-    print("[SERVICES] poll_inputs() : (factice) -> aucune entrée")
+    if trace:
+        pol.write(4, "[SERVICES] poll_inputs() : (factice) -> aucune entrée", "log")
 
-def update_game_state(dt: float):
+def update_game_state(dt: float, trace: bool = False):
     # dt = temps écoulé depuis le dernier tick
-    print(f"[SERVICES] update_game_state(dt={dt:.3f}s) : (factice)")
+    if trace:
+        pol.write(4, f"[SERVICES] update_game_state(dt={dt:.3f}s) : (factice)", "log")
 
-def render_frame():
+def render_frame(trace: bool = False):
     # Dans un vrai projet : dessin UI / logs / métriques…
-    print("[SERVICES] render_frame() : (factice)")
+    if trace:
+        pol.write(4, "[SERVICES] render_frame() : (factice)", "log")
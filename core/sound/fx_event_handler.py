@@ -5,7 +5,7 @@
 Écoute les événements fx.* sur le bus et déclenche la génération d'effets.
 """
 
-from core.sound.fx_generator import fx_generator, Priority
+from core.sound.fx_generator import get_fx_generator, priority_from_str, Priority
 
 class FXEventHandler:
     """Gestionnaire d'événements pour la génération d'effets"""
@@ -31,18 +31,12 @@ class FXEventHandler:
         requester = payload.get("requester", "unknown")
         
         # Convertir priorité string → enum
-        priority_map = {
-            "low": Priority.LOW,
-            "normal": Priority.NORMAL, 
-            "high": Priority.HIGH,
-            "urgent": Priority.URGENT
-        }
-        priority = priority_map.get(priority_str, Priority.NORMAL)
+        priority = priority_from_str(priority_str, Priority.NORMAL)
         
         print(f"🎛️ Bus: Génération effet {effect_type} (priorité: {priority_str}, requester: {requester})")
         
         # Déclencher génération asynchrone
-        success = fx_generator.create_async(source_path, effect_type, force_remake, priority)
+        success = get_fx_generator().create_async(source_path, effect_type, force_remake, priority)
         
         if success:
             print(f"✅ Effet {effect_type} programmé")
@@ -60,21 +54,12 @@ class FXEventHandler:
         requester = payload.get("requester", "unknown")
         
         # Convertir priorité
-        priority_map = {
-            "low": Priority.LOW,
-            "normal": Priority.NORMAL,
-            "high": Priority.HIGH, 
-            "urgent": Priority.URGENT
-        }
-        priority = priority_map.get(priority_str, Priority.LOW)
+        priority = priority_from_str(priority_str, Priority.LOW)
         
         print(f"🎛️ Bus: Génération toutes variantes {effects} (priorité: {priority_str}, requester: {requester})")
         
-        # Programmer chaque effet
-        programmed = 0
-        for effect in effects:
-            if fx_generator.create_async(source_path, effect, force_remake, priority):
-                programmed += 1
+        # Programmer tous les effets en un seul passage
+        programmed = get_fx_generator().create_async_batch(source_path, effects, force_remake, priority)
         
         print(f"✅ {programmed}/{len(effects)} variantes programmées")
 
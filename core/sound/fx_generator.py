@@ -6,19 +6,55 @@ Module dédié à la génération des variantes d'effets en arrière-plan.
 Interface simple : fx.create(source_path, effect, force_remake=False)
 """
 
+import heapq
+import itertools
+import os
+import sys
 import threading
 import time
 import logging
 from pathlib import Path
-from queue import Queue, PriorityQueue
 from typing import Dict, Optional, List
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import IntEnum
 import numpy as np
+import soundfile as sf
 from scipy.signal import butter, filtfilt
 from core.pol import create_pol
 pol = create_pol(source_id=51)
 
+# Cache des tests d'existence de fichiers : les fichiers d'effets sont écrits une fois par job
+_STAT_TTL = 2.0           # secondes
+_STAT_CACHE_MAX = 512     # entrées (LRU)
+_stat_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_stat_lock = threading.Lock()
+
+# Cache de l'audio source décodé : une source est relue une fois pour toutes ses variantes
+_AUDIO_CACHE_MAX = 4      # entrées (LRU)
+
+def _exists_cached(path) -> bool:
+    """os.path.exists mémorisé quelques secondes (évite les stat répétés d'une rafale de jobs)"""
+    key = str(path)
+    now = time.monotonic()
+    with _stat_lock:
+        entry = _stat_cache.get(key)
+        if entry is not None and now - entry[0] < _STAT_TTL:
+            _stat_cache.move_to_end(key)
+            return entry[1]
+    exists = os.path.exists(key)
+    with _stat_lock:
+        _stat_cache[key] = (now, exists)
+        _stat_cache.move_to_end(key)
+        if len(_stat_cache) > _STAT_CACHE_MAX:
+            _stat_cache.popitem(last=False)
+    return exists
+
+def _invalidate_exists(path):
+    """Oublie l'état mémorisé d'un fichier (après écriture)"""
+    with _stat_lock:
+        _stat_cache.pop(str(path), None)
+
 class Priority(IntEnum):
     """Priorités des tâches de génération"""
     LOW = 3      # Génération proactive
@@ -26,7 +62,21 @@ class Priority(IntEnum):
     HIGH = 1     # Régénération forcée
     URGENT = 0   # Erreur de lecture, fallback immédiat
 
-@dataclass
+# Conversion priorité string (bus) → enum, clés internées : lookup par identité
+PRIORITY_MAP = {sys.intern(k): v for k, v in {
+    "low": Priority.LOW,
+    "normal": Priority.NORMAL,
+    "high": Priority.HIGH,
+    "urgent": Priority.URGENT
+}.items()}
+
+def priority_from_str(priority_str, default: Priority = Priority.NORMAL) -> Priority:
+    """Convertit la priorité reçue sur le bus ("low", "normal", ...) en Priority"""
+    if not isinstance(priority_str, str):
+        return default
+    return PRIORITY_MAP.get(sys.intern(priority_str), default)
+
+@dataclass(slots=True)
 class GenerationJob:
     """Tâche de génération d'effet"""
     priority: Priority
@@ -34,25 +84,25 @@ class GenerationJob:
     target_path: str           # Chemin du fichier effet.wav
     effect_type: str           # "ship", "city", "helmet"
     force_remake: bool = False # True = régénérer même si existe
-    timestamp: float = 0.0     # Pour tri temporel
-    
-    def __post_init__(self):
-        if self.timestamp == 0.0:
-            self.timestamp = time.time()
-    
-    def __lt__(self, other):
-        # Priorité puis timestamp (FIFO pour même priorité)
-        if self.priority != other.priority:
-            return self.priority < other.priority
-        return self.timestamp < other.timestamp
+    timestamp: int = field(default_factory=time.monotonic_ns)  # Date de création (ns, monotone)
+    queued: bool = True        # True = en file, False = en cours de traitement
+    done: threading.Event = field(default_factory=threading.Event)  # Levé en fin de traitement (succès ou échec)
+    success: bool = False      # Résultat du traitement, valide une fois done levé
+    rerun: bool = False        # Redemandé (force_remake) pendant le traitement : reprogrammé à la fin
 
 class FXGenerator:
     """Générateur d'effets audio en arrière-plan"""
     
     def __init__(self, max_workers: int = 1):
         self.max_workers = max_workers
-        self.generation_queue = PriorityQueue()
-        self.active_jobs = set()  # Éviter les doublons
+        # File de priorité : tas (heapq) protégé par une condition, taille lisible sans verrou
+        # Entrées (priorité, séquence, job) : comparaison d'entiers, FIFO à priorité égale
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._cv = threading.Condition()
+        self._size = 0
+        # Jobs en file ou en cours par clé "source:effet" (dédoublonnage), protégé par self._cv
+        self._pending: Dict[str, GenerationJob] = {}
         self.workers = []
         self.running = False
         self.stats = {
@@ -61,10 +111,14 @@ class FXGenerator:
             "skipped": 0,
             "queue_peak": 0
         }
+        self._stats_lock = threading.Lock()  # Compteurs mis à jour par plusieurs workers
         
         # Configuration des effets
         self.AVAILABLE_EFFECTS = ["ship", "city", "helmet"]
-        self.effects_processor = None  # Lazy loading
+        self._local = threading.local()  # Un processeur d'effets par worker (lazy loading, non thread-safe)
+        self._audio_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # (source, mtime) → (audio, sample_rate)
+        self._audio_lock = threading.Lock()  # Protège le cache audio (un seul décodage par source)
+        self._known_dirs: set = set()  # Répertoires cibles déjà créés (un mkdir par répertoire)
         
         self._start_workers()
     
@@ -93,17 +147,172 @@ class FXGenerator:
         target_path = self._get_target_path(source_path, effect)
         
         # Vérifier si déjà existe (sauf si force_remake)
-        if not force_remake and Path(target_path).exists():
-            pol.write(1, f"Effet déjà existant: {effect} pour {Path(source_path).name}", mode="log")
+        if not force_remake and _exists_cached(target_path):
+            if pol.enabled(1):
+                pol.write(1, f"Effet déjà existant: {effect} pour {Path(source_path).name}", mode="log")
             #logging.debug(f"✅ Effet déjà existant: {effect} -> {Path(target_path).name}")
             return True
         
-        # Éviter les doublons dans la queue
+        # Vérification des doublons et ajout sous le même verrou (pas de course entre threads)
+        with self._cv:
+            queued = self._schedule_locked(source_path, effect, target_path, force_remake, priority)
+            queue_size = self._size
+            if queued:
+                self._cv.notify()
+        
+        if queued:
+            self._update_queue_peak(queue_size)
+        return True
+    
+    def create_async_batch(self, source_path: str, effects: List[str], force_remake: bool = False, priority: Priority = Priority.NORMAL) -> int:
+        """
+        Programme plusieurs effets pour une même source (asynchrone)
+        
+        La source est validée une seule fois et tous les jobs sont ajoutés
+        sous une seule prise du verrou de la file.
+        
+        Args:
+            source_path: Chemin du fichier brut.wav
+            effects: Types d'effets ("ship", "city", "helmet")
+            force_remake: True = régénérer même si existe
+            priority: Priorité des tâches
+            
+        Returns:
+            Nombre d'effets programmés (ou déjà existants / déjà en queue)
+        """
+        
+        if not _exists_cached(source_path):
+            pol.write(3, f"⚠️ Fichier source inexistant: {source_path}", mode="log+print")
+            return 0
+        
+        existing, to_schedule = self._batch_targets(source_path, effects, force_remake)
+        accepted = len(existing) + len(to_schedule)
+        if not to_schedule:
+            return accepted
+        
+        with self._cv:
+            queued = 0
+            for effect, target_path in to_schedule:
+                if self._schedule_locked(source_path, effect, target_path, force_remake, priority):
+                    queued += 1
+            queue_size = self._size
+            if queued:
+                self._cv.notify_all()
+        
+        if queued:
+            self._update_queue_peak(queue_size)
+        return accepted
+    
+    def create_and_wait(self, source_path: str, effects: List[str], force_remake: bool = False,
+                        priority: Priority = Priority.NORMAL, timeout: float = 15.0) -> Dict[str, bool]:
+        """
+        Programme plusieurs effets pour une même source et attend leur génération
+        
+        L'attente se fait sur le signal de fin de chaque job (pas de polling) : un job
+        identique déjà en file ou en cours est attendu au lieu d'être dupliqué.
+        
+        Args:
+            source_path: Chemin du fichier brut.wav
+            effects: Types d'effets ("ship", "city", "helmet")
+            force_remake: True = régénérer même si existe
+            priority: Priorité des tâches
+            timeout: Attente maximale pour l'ensemble des effets (secondes)
+            
+        Returns:
+            Dict[str, bool]: Succès par effet (False si inconnu, en échec ou non terminé à temps)
+        """
+        results = {effect: False for effect in effects}
+        if not _exists_cached(source_path):
+            pol.write(3, f"⚠️ Fichier source inexistant: {source_path}", mode="log+print")
+            return results
+        
+        existing, to_schedule = self._batch_targets(source_path, effects, force_remake)
+        for effect in existing:
+            results[effect] = True
+        
+        # Programmer et récupérer les jobs à attendre sous la même prise du verrou :
+        # un job ne peut pas se terminer et disparaître de _pending entre les deux
+        waiting = []
+        with self._cv:
+            queued = 0
+            for effect, target_path in to_schedule:
+                if self._schedule_locked(source_path, effect, target_path, force_remake, priority):
+                    queued += 1
+                job = self._pending.get(f"{source_path}:{effect}")
+                if job is not None:
+                    waiting.append((effect, job))
+            queue_size = self._size
+            if queued:
+                self._cv.notify_all()
+        
+        if queued:
+            self._update_queue_peak(queue_size)
+        
+        deadline = time.monotonic() + timeout
+        for effect, job in waiting:
+            results[effect] = job.done.wait(max(0.0, deadline - time.monotonic())) and job.success
+        return results
+    
+    def _batch_targets(self, source_path: str, effects: List[str], force_remake: bool):
+        """
+        Trie les effets d'un lot : déjà générés, ou à programmer (effets inconnus signalés et ignorés)
+        
+        Returns:
+            (effets déjà existants, [(effet, chemin cible)] à programmer)
+        """
+        existing = []
+        to_schedule = []
+        for effect in effects:
+            if effect not in self.AVAILABLE_EFFECTS:
+                pol.write(3, f"⚠️ Effet inconnu: {effect}. Disponibles: {self.AVAILABLE_EFFECTS}", mode="log+print")
+                continue
+            
+            target_path = self._get_target_path(source_path, effect)
+            if not force_remake and _exists_cached(target_path):
+                if pol.enabled(1):
+                    pol.write(1, f"Effet déjà existant: {effect} pour {Path(source_path).name}", mode="log")
+                existing.append(effect)
+                continue
+            to_schedule.append((effect, target_path))
+        return existing, to_schedule
+    
+    def _schedule_locked(self, source_path: str, effect: str, target_path, force_remake: bool, priority: Priority) -> bool:
+        """
+        Ajoute un job à la file, ou le fusionne avec un job identique déjà en file
+        (à appeler avec self._cv acquis)
+        
+        Returns:
+            True si un nouveau job a été ajouté au tas
+        """
         job_key = f"{source_path}:{effect}"
-        if job_key in self.active_jobs and not force_remake:
-            pol.write(1, f"Job déjà en queue: {job_key}", mode="log")
+        
+        pending = self._pending.get(job_key)
+        if pending is not None and pending.queued:
+            # Déjà en file : on fusionne (priorité la plus urgente, force_remake cumulé)
+            pending.force_remake = pending.force_remake or force_remake
+            if priority < pending.priority:
+                # Nouvelle entrée plus urgente, l'ancienne sera ignorée au dépilement
+                pending.priority = priority
+                heapq.heappush(self._heap, (int(priority), next(self._seq), pending))
+            if pol.enabled(1):
+                pol.write(1, f"Job déjà en queue: {job_key}", mode="log")
+            return False
+        
+        if pending is not None and not force_remake:
+            if pol.enabled(1):
+                pol.write(1, f"Job déjà en cours: {job_key}", mode="log")
             #logging.debug(f"⏸️ Job déjà en queue: {job_key}")
-            return True
+            return False
+        
+        if pending is not None:
+            # En cours avec force_remake : jamais deux workers sur le même fichier cible,
+            # le job sera relancé par son worker une fois le traitement actuel terminé
+            pending.rerun = True
+            if priority < pending.priority:
+                pending.priority = priority
+            if pol.enabled(1):
+                pol.write(1, f"Job en cours, régénération à la suite: {job_key}", mode="log")
+            return False
         
         # Créer et ajouter le job
         job = GenerationJob(
@@ -114,18 +323,43 @@ class FXGenerator:
             force_remake=force_remake
         )
         
-        self.active_jobs.add(job_key)
-        self.generation_queue.put(job)
+        self._pending[job_key] = job
+        heapq.heappush(self._heap, (int(priority), next(self._seq), job))
+        self._size += 1
         
-        # Statistiques
-        queue_size = self.generation_queue.qsize()
-        if queue_size > self.stats["queue_peak"]:
-            self.stats["queue_peak"] = queue_size
-        
-        pol.write(1, f"Job programmé: {effect} pour {Path(source_path).parent.name} (priorité: {priority.name})", mode="log")
+        if pol.enabled(1):
+            pol.write(1, f"Job programmé: {effect} pour {Path(source_path).parent.name} (priorité: {priority.name})", mode="log")
         #print(f"📋 Job programmé: {effect} pour {Path(source_path).parent.name} (priorité: {priority.name})")
         return True
     
+    def _pop_job_locked(self) -> Optional[GenerationJob]:
+        """
+        Dépile le job le plus prioritaire (à appeler avec self._cv acquis)
+        
+        Returns:
+            Le job, ou None si la file est vide
+        """
+        while self._heap:
+            _, _, job = heapq.heappop(self._heap)
+            job_key = f"{job.source_path}:{job.effect_type}"
+            if job.queued and self._pending.get(job_key) is job:
+                job.queued = False  # Reste dans _pending jusqu'à la fin du traitement
+                self._size -= 1
+                return job
+            # Entrée périmée (job déjà dépilé via une priorité relevée) : ignorer
+        return None
+    
+    def _update_queue_peak(self, queue_size: int):
+        """Statistiques : taille max atteinte par la file"""
+        with self._stats_lock:
+            if queue_size > self.stats["queue_peak"]:
+                self.stats["queue_peak"] = queue_size
+    
+    def _count(self, stat: str):
+        """Statistiques : incrémente un compteur (appelé depuis les workers)"""
+        with self._stats_lock:
+            self.stats[stat] += 1
+    
     # =========================================================================
     # 🔧 TRAITEMENT DES JOBS
     # =========================================================================
@@ -134,48 +368,85 @@ class FXGenerator:
         """Traite un job de manière synchrone"""
         
         try:
-            # Initialiser le processeur si nécessaire
-            if self.effects_processor is None:
-                self._init_effects_processor()
+            # Processeur propre à ce worker (initialisé si nécessaire)
+            processor = self._get_processor()
             
-            # Charger l'audio source
-            if not self.effects_processor.load_audio(job.source_path):
+            # Charger l'audio source (décodé une seule fois pour toutes les variantes)
+            if not self._load_source(processor, job.source_path):
                 pol.write(3, f"❌ Impossible de charger: {job.source_path}", mode="log+print")
-                self.stats["errors"] += 1
+                self._count("errors")
                 return False
             
             # Vérifier si target existe déjà (sauf force_remake)
-            if not job.force_remake and Path(job.target_path).exists():
+            if not job.force_remake and _exists_cached(job.target_path):
                 pol.write(1, f"⏭️ Effet déjà existant: {Path(job.target_path).name}", mode="log")
-                self.stats["skipped"] += 1
+                self._count("skipped")
                 return True
             
             # Traitement de l'effet
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
             effect_config = self._get_effect_config(job.effect_type)
             
-            processed = self.effects_processor._apply_environment_effects(
-                self.effects_processor.audio_data.copy(),
-                effect_config
-            )
+            # Vue en lecture seule : les filtres d'environnement allouent leur propre sortie
+            # (ou travaillent sur une copie locale), inutile de dupliquer le buffer source
+            source_view = processor.audio_data.view()
+            source_view.flags.writeable = False
+            processed = processor._apply_environment_effects(source_view, effect_config)
             
-            # Créer le répertoire cible si nécessaire
-            Path(job.target_path).parent.mkdir(parents=True, exist_ok=True)
+            # Créer le répertoire cible si nécessaire (une seule fois par répertoire)
+            target_dir = os.path.dirname(job.target_path)
+            if target_dir not in self._known_dirs:
+                Path(target_dir).mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(target_dir)
             
             # Sauvegarder le résultat
-            import soundfile as sf
-            sf.write(job.target_path, processed, self.effects_processor.sample_rate)
+            # PCM 16 bits explicite (défaut WAV de soundfile) : conversion float → int16 faite par libsndfile
+            sf.write(job.target_path, processed, processor.sample_rate, subtype='PCM_16')
+            _invalidate_exists(job.target_path)
             
-            processing_time = time.time() - start_time
-            self.stats["generated"] += 1
+            processing_time = (time.monotonic_ns() - start_ns) / 1e9
+            self._count("generated")
             pol.write(1, f"✅ Généré {job.effect_type}: {Path(job.target_path).name} ({processing_time:.2f}s)", mode="log")
             return True
             
         except Exception as e:
             pol.write(3, f"❌ Erreur génération {job.effect_type}: {e}", mode="log+print")
-            self.stats["errors"] += 1
+            self._count("errors")
             return False
     
+    def _load_source(self, processor, source_path: str) -> bool:
+        """
+        Charge l'audio source dans le processeur du worker, via le cache (source, mtime)
+        
+        Le décodage se fait sous le verrou du cache : les workers qui traitent
+        les variantes d'une même source attendent ce décodage au lieu de le refaire.
+        
+        Returns:
+            True si l'audio est chargé
+        """
+        try:
+            key = (source_path, os.stat(source_path).st_mtime)
+        except OSError:
+            key = None  # load_audio signalera l'erreur
+        
+        with self._audio_lock:
+            cached = self._audio_cache.get(key) if key is not None else None
+            if cached is not None:
+                self._audio_cache.move_to_end(key)
+                processor.audio_data, processor.sample_rate = cached
+                return True
+            
+            if not processor.load_audio(source_path):
+                return False
+            
+            if key is not None:
+                audio_data = processor.audio_data
+                audio_data.flags.writeable = False  # Partagé entre variantes : lecture seule
+                self._audio_cache[key] = (audio_data, processor.sample_rate)
+                while len(self._audio_cache) > _AUDIO_CACHE_MAX:
+                    self._audio_cache.popitem(last=False)
+        return True
+    
     def _process_job_async(self, job: GenerationJob):
         """Traite un job de manière asynchrone (worker thread)"""
         
@@ -183,6 +454,7 @@ class FXGenerator:
         
         try:
             success = self._process_job_sync(job)
+            job.success = success
             
             if success:
                 # Logger seulement si succès
@@ -199,11 +471,23 @@ class FXGenerator:
                 pass  # Ignorer les erreurs de logging
                 
         finally:
-            # Nettoyer le job des actifs dans tous les cas
-            try:
-                self.active_jobs.discard(job_key)
-            except:
-                pass  # Même si ça échoue, continuer
+            # Nettoyer le job des actifs dans tous les cas, sauf s'il a été redemandé entre-temps :
+            # il repart alors en file (même clé, les appelants attendent ce nouveau passage)
+            requeued = False
+            with self._cv:
+                if self._pending.get(job_key) is job:
+                    if job.rerun:
+                        job.rerun = False
+                        job.queued = True
+                        job.force_remake = True
+                        heapq.heappush(self._heap, (int(job.priority), next(self._seq), job))
+                        self._size += 1
+                        self._cv.notify()
+                        requeued = True
+                    else:
+                        del self._pending[job_key]
+            if not requeued:
+                job.done.set()  # Réveiller les appelants de create_and_wait
 
     def _worker_loop(self):
         """Boucle principale d'un worker"""
@@ -211,35 +495,31 @@ class FXGenerator:
         while self.running:
             try:
                 # Attendre un job (timeout pour permettre l'arrêt)
-                job = self.generation_queue.get(timeout=1.0)
+                with self._cv:
+                    job = None
+                    while self.running:
+                        job = self._pop_job_locked()
+                        if job is not None:
+                            break
+                        self._cv.wait(timeout=1.0)
+                if job is None:
+                    continue
                 
                 # Traiter le job
                 self._process_job_async(job)
                 
-                # Marquer comme terminé
-                self.generation_queue.task_done()
-                
-                # Pause pour limiter l'impact CPU
-                time.sleep(0.1)  # 100ms entre jobs
-                
             except Exception as e:
                 # 🔧 FIX: Gestion plus robuste des erreurs
                 error_type = type(e).__name__
+                try:
+                    pol.write(3, f"❌ Erreur worker FX ({error_type}): {e}", mode="log+print")
+                    # Ne pas faire de traceback complet pour éviter les exceptions en cascade
+                except:
+                    # Si même le print échoue, juste continuer
+                    pass
                 
-                if "Empty" in str(e) or error_type == "Empty":
-                    # Timeout normal de la queue, continuer silencieusement
-                    continue
-                else:
-                    # Vraie erreur à logger
-                    try:
-                        pol.write(3, f"❌ Erreur worker FX ({error_type}): {e}", mode="log+print")
-                        # Ne pas faire de traceback complet pour éviter les exceptions en cascade
-                    except:
-                        # Si même le print échoue, juste continuer
-                        pass
-                    
-                    # Continuer le worker même en cas d'erreur
-                    continue
+                # Continuer le worker même en cas d'erreur
+                continue
     
     # =========================================================================
     # 🛠️ MÉTHODES UTILITAIRES
@@ -248,7 +528,7 @@ class FXGenerator:
     def _validate_inputs(self, source_path: str, effect: str) -> bool:
         """Valide les paramètres d'entrée"""
         
-        if not Path(source_path).exists():
+        if not _exists_cached(source_path):
             pol.write(3, f"⚠️ Fichier source inexistant: {source_path}", mode="log+print")
             return False
         
@@ -270,7 +550,8 @@ class FXGenerator:
             target_dir = source.parent
             target_file = target_dir / f"{effect}.wav"
             
-            pol.write(1, f"🎨 Source SKIN détectée: {source.name} → {target_file.name}", mode="log")
+            if pol.enabled(1):
+                pol.write(1, f"🎨 Source SKIN détectée: {source.name} → {target_file.name}", mode="log")
             return target_file
         
         elif source.name == "brut.wav":
@@ -279,7 +560,8 @@ class FXGenerator:
             target_dir = source.parent
             target_file = target_dir / f"{effect}.wav"
             
-            pol.write(1, f"🎤 Source BRUT détectée: {source.name} → {target_file.name}", mode="log")
+            if pol.enabled(1):
+                pol.write(1, f"🎤 Source BRUT détectée: {source.name} → {target_file.name}", mode="log")
             return target_file
         
         else:
@@ -326,12 +608,24 @@ class FXGenerator:
         
         return base_config
     
+    def _get_processor(self):
+        """Retourne le processeur d'effets du worker courant (créé au premier job)"""
+        processor = getattr(self._local, "processor", None)
+        if processor is None:
+            processor = self._init_effects_processor()
+            self._local.processor = processor
+        return processor
+    
     def _init_effects_processor(self):
-        """Initialise le processeur d'effets (lazy loading)"""
+        """Initialise un processeur d'effets (lazy loading, un par worker)"""
         try:
             from test_voice_effects import VoiceEffectsProcessor
-            self.effects_processor = VoiceEffectsProcessor()
-            pol.write(1, "🔧 Processeur d'effets initialisé", mode="log+print")
+            processor = VoiceEffectsProcessor()
+            # Fichiers temporaires FFmpeg nommés à la milliseconde : un dossier par worker évite les collisions
+            processor.temp_dir = processor.temp_dir / threading.current_thread().name
+            processor.temp_dir.mkdir(parents=True, exist_ok=True)
+            pol.write(1, f"🔧 Processeur d'effets initialisé ({threading.current_thread().name})", mode="log+print")
+            return processor
         except ImportError as e:
             pol.write(3, f"❌ Impossible d'importer VoiceEffectsProcessor: {e}", mode="log+print")
             pol.write(3, "💡 Assurez-vous que test_voice_effects.py est accessible", mode="log+print")
@@ -390,8 +684,8 @@ class FXGenerator:
         return {
             "running": self.running,
             "workers_count": len(self.workers),
-            "queue_size": self.generation_queue.qsize(),
-            "active_jobs": len(self.active_jobs),
+            "queue_size": self._size,
+            "active_jobs": len(self._pending),
             "stats": self.stats.copy(),
             "available_effects": self.AVAILABLE_EFFECTS.copy()
         }
@@ -402,22 +696,24 @@ class FXGenerator:
             return
         
         pol.write(1, "🛑 Arrêt du FX Generator...", mode="log+print")
-        self.running = False
+        with self._cv:
+            self.running = False
+            self._cv.notify_all()  # Réveiller les workers en attente
         
         # Attendre que les workers se terminent
         for worker in self.workers:
             if worker.is_alive():
                 worker.join(timeout=timeout/len(self.workers))
         
-        # Vider la queue
-        while not self.generation_queue.empty():
-            try:
-                self.generation_queue.get_nowait()
-            except:
-                break
+        # Vider la queue (les jobs abandonnés libèrent leurs appelants en échec)
+        with self._cv:
+            for job in self._pending.values():
+                job.done.set()
+            self._heap.clear()
+            self._pending.clear()
+            self._size = 0
         
         self.workers.clear()
-        self.active_jobs.clear()
         pol.write(1, f"✅ FX Generator arrêté. Stats: {self.stats}", mode="log")
         
 
@@ -440,21 +736,41 @@ class FXGenerator:
 # 🎯 INSTANCE GLOBALE
 # =============================================================================
 
-# Instance globale du générateur (singleton pattern)
-fx_generator = FXGenerator(max_workers=1)
-
-# Ajouter ces méthodes dans la section "🏃 WORKERS ET GESTION THREADS" :
+# Instance globale du générateur (singleton pattern), créée au premier usage :
+# importer le module ne démarre aucun thread
+fx_generator: Optional[FXGenerator] = None
+_fx_generator_lock = threading.Lock()
 
+def get_fx_generator() -> FXGenerator:
+    """
+    Retourne l'instance singleton du FX Generator (créée et démarrée au premier appel)
+    
+    Returns:
+        FXGenerator: Instance singleton
+    """
+    global fx_generator
+    
+    with _fx_generator_lock:
+        if fx_generator is None:
+            # Variantes indépendantes (ship/city/helmet) traitées en parallèle, en laissant un cœur libre
+            fx_generator = FXGenerator(max_workers=max(1, min(3, (os.cpu_count() or 1) - 1)))
+        
+        return fx_generator
 
 
 def create_async(source_path: str, effect: str, force_remake: bool = False) -> bool:
     """Interface simplifiée pour génération asynchrone"""
-    return fx_generator.create_async(source_path, effect, force_remake)
+    return get_fx_generator().create_async(source_path, effect, force_remake)
+
+def create_async_batch(source_path: str, effects: List[str], force_remake: bool = False) -> int:
+    """Interface simplifiée pour génération asynchrone de plusieurs effets"""
+    return get_fx_generator().create_async_batch(source_path, effects, force_remake)
 
 def get_status() -> Dict:
     """Interface simplifiée pour le statut"""
-    return fx_generator.get_status()
+    return get_fx_generator().get_status()
 
 def stop():
     """Interface simplifiée pour l'arrêt"""
-    fx_generator.stop()
\ No newline at end of file
+    if fx_generator is not None:
+        fx_generator.stop()
@@ -9,13 +9,24 @@ Gestionnaire principal pour :
 Interface simple :
 - fx.create_skin_for(path) → Crée skin.wav depuis brut.wav
 - fx.create_for(path, effects=["ship"]) → Crée skin + effets demandés
+
+Le FXProcessor est créé au premier usage puis conservé ; prepare() est appelé
+une fois à sa création (chemin FFmpeg).
 """
 
 from __future__ import annotations
 from pathlib import Path
-from typing import Union, List, Dict, Any
+from typing import Union, List, Dict, Any, Tuple
+from collections import OrderedDict
+import functools
+import hashlib
+import json
+import os
+import queue
+import shutil
 import threading
 import time
+import traceback
 from core.pol import create_pol
 pol = create_pol(source_id=50)
 
@@ -23,9 +34,113 @@ pol = create_pol(source_id=50)
 _fx_manager_instance = None
 _fx_manager_lock = threading.Lock()
 
+# Demande "tous les effets" : les appelants peuvent passer fx_manager.ALL (test par identité)
+ALL = "all"
+
+# Nom du skin à côté de chaque brut.wav (connu d'avance : pas de Path.name à recalculer pour les logs)
+_SKIN_NAME = "skin.wav"
+
+# Cache des skins par contenu : sha256(brut.wav + paramètres skin) → wav déjà généré
+# (dossier sound/ du projet, indépendant du répertoire de lancement)
+_SKIN_CACHE_DIR = Path(__file__).resolve().parents[2] / "sound" / "skin_cache"
+_SKIN_CACHE_MAX = 256  # Entrées conservées (les plus anciennes sont supprimées)
+# Fiche à côté de skin.wav : "<clé du cache> <taille> <mtime_ns>" du skin au moment où il a été produit
+_SKIN_KEY_NAME = "skin.key"
+_HASH_CHUNK = 1 << 20  # Lecture par blocs de 1 Mio pour le hachage
+_SOURCE_DIGEST_MAX = 1024  # Empreintes de sources mémorisées (LRU)
+
+# Erreurs déjà signalées avec traceback : (contexte, type, message), les répétitions n'en réaffichent pas
+_TRACEBACKS_MAX = 256
+_seen_tracebacks: "OrderedDict[tuple, None]" = OrderedDict()
+_seen_tracebacks_lock = threading.Lock()
+
+
+def _log_exception(context: str, e: Exception):
+    """Signale une erreur ; la traceback n'est affichée qu'à la première occurrence"""
+    key = (context, type(e), str(e))
+    with _seen_tracebacks_lock:
+        first = key not in _seen_tracebacks
+        if first:
+            _seen_tracebacks[key] = None
+            if len(_seen_tracebacks) > _TRACEBACKS_MAX:
+                _seen_tracebacks.popitem(last=False)
+    
+    if first:
+        pol.write(3, f"❌ Erreur {context}: {e}", mode="log+print")
+        traceback.print_exc()
+    else:
+        pol.write(3, f"❌ Erreur {context}: {e} (répétée)", mode="log")
+
+def _prune_skin_cache():
+    """
+    Limite le cache skin aux _SKIN_CACHE_MAX entrées les plus récentes (mtime)
+    
+    Les entrées ne sont jamais touchées à la lecture : leur inode est partagé avec
+    les skin.wav liés, dont skin.key enregistre le mtime.
+    """
+    entries = []
+    try:
+        with os.scandir(_SKIN_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".wav"):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except OSError:
+                        pass
+    except OSError:
+        return  # Pas encore de cache
+    
+    if len(entries) <= _SKIN_CACHE_MAX:
+        return
+    entries.sort()
+    # Un skin.wav lié à une entrée supprimée reste intact (lien dur)
+    for _, path in entries[:-_SKIN_CACHE_MAX]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+def _clear_skin_cache():
+    """
+    Vide le cache skin (purge ou régénération forcée demandée)
+    
+    Les skin.wav déjà liés restent intacts (lien dur) : seule la réutilisation est coupée.
+    """
+    removed = 0
+    try:
+        with os.scandir(_SKIN_CACHE_DIR) as it:
+            for entry in it:
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+    except OSError:
+        return  # Pas encore de cache
+    pol.write(1, f"🗑️ Cache skin vidé: {removed} fichier(s)", mode="log")
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_paths(source_path: str) -> Tuple[Path, str, str, Path, str]:
+    """
+    Chemins dérivés d'un chemin source, mémorisés (mêmes brut.wav redemandés)
+    
+    Returns:
+        (source, source en str, dossier parent en str, skin.wav, skin.wav en str)
+    """
+    source = Path(source_path)
+    parent = source.parent
+    skin_path = parent / _SKIN_NAME
+    return source, str(source), str(parent), skin_path, str(skin_path)
+
 class FXManager:
     """Gestionnaire unifié pour tous les effets audio"""
     
+    # Effets environment disponibles (ordre conservé) et ensemble pour les tests d'appartenance
+    _AVAILABLE_EFFECTS = ("ship", "city", "helmet")
+    _AVAILABLE_SET = frozenset(_AVAILABLE_EFFECTS)
+    # Plan fixe de la demande ALL : (effets, fichiers cibles)
+    _ALL_PLAN = (_AVAILABLE_EFFECTS, tuple(f"{e}.wav" for e in _AVAILABLE_EFFECTS))
+    
     def __init__(self, config_manager, event_bus):
         """
         Initialise le FX Manager
@@ -37,15 +152,65 @@ class FXManager:
         self.config_manager = config_manager
         self.event_bus = event_bus
         self.processor = None  # Sera initialisé lors de la première utilisation
+        # (paramètres skin, empreinte sha256 de leur forme canonique) lus dans la config,
+        # vidé à chaque sauvegarde/rechargement
+        self._skin_params_cache = None
+        # Empreinte sha256 du contenu des sources : chemin → ((mtime_ns, taille), empreinte)
+        self._source_digests: "OrderedDict[str, tuple]" = OrderedDict()
+        self._source_digests_lock = threading.Lock()
+        
+        # Invalider le cache des paramètres skin quand la configuration change
+        self.event_bus.subscribe(self._on_bus_event)
+        
+        # Événements de monitoring publiés par un thread dédié : la génération
+        # ne s'exécute jamais dans les abonnés du bus (livraison asynchrone, best-effort)
+        self._event_q = queue.SimpleQueue()
+        self._pub_thread = threading.Thread(
+            target=self._publish_loop,
+            daemon=True,
+            name="FXManagerPublish"
+        )
+        self._pub_thread.start()
+        
+        # Borner le cache skin laissé par les sessions précédentes
+        _prune_skin_cache()
 
         pol.write(1, "🎛️ FX Manager initialisé", mode="log")
         print("🎛️ FX Manager initialisé")
     
+    def _on_bus_event(self, message):
+        """
+        Vide le cache des paramètres skin sur sauvegarde/rechargement de la config,
+        et le cache des skins sur purge ou régénération forcée
+        """
+        name = message.get("name")
+        if name == "config" and message.get("state") in ("saved", "reloaded"):
+            self._skin_params_cache = None
+        elif message.get("state") == "request" and (
+            name == "cache.purge_skin"
+            or (name == "cache.update_skin" and (message.get("payload") or {}).get("force_regenerate"))
+        ):
+            # Synchrone (≤ _SKIN_CACHE_MAX fichiers) : un skin redemandé juste après ne réutilise pas l'ancien
+            _clear_skin_cache()
+    
+    def _publish_loop(self):
+        """Publie sur le bus les événements déposés dans self._event_q"""
+        get = self._event_q.get
+        while True:
+            message = get()
+            try:
+                self.event_bus.publish(message)
+            except Exception as e:
+                # Bus fragile : un abonné défaillant ne doit pas arrêter la publication
+                pol.write(3, f"❌ Erreur publication: {e}", mode="log")
+    
     def _get_processor(self):
         """Lazy loading du processor pour éviter les imports circulaires"""
         if self.processor is None:
             from core.sound.fx_processor import FXProcessor
-            self.processor = FXProcessor(self.config_manager, self.event_bus)
+            processor = FXProcessor(self.config_manager, self.event_bus)
+            processor.prepare()
+            self.processor = processor
         return self.processor
     
     def create_skin_for(self, source_path: str) -> bool:
@@ -59,49 +224,67 @@ class FXManager:
             bool: True si succès
         """
         try:
-            source = Path(source_path)
+            source, source_str, _, skin_path, skin_str = _resolve_paths(source_path)
             
-            if not source.exists():
+            if not os.path.isfile(source_path):
                 pol.write(3, f"❌ Fichier source introuvable: {source}", mode="log+print")
                 return False
             
-            # Calculer le chemin skin
-            skin_path = source.parent / "skin.wav"
-            
-            pol.write(1, f"🎨 Création skin: {source.name} → {skin_path.name}", mode="log")
+            if pol.enabled(1):
+                pol.write(1, f"🎨 Création skin: {source.name} → {_SKIN_NAME}", mode="log")
 
-            # Publier événement de monitoring (bus fragile, on protège)
-            try:
-                self.event_bus.publish({
-                    "name": "skin.create",
-                    "state": "request",
-                    "payload": {
-                        "source_path": str(source),
-                        "target_path": str(skin_path),
-                        "requester": "fx_manager"
-                    }
-                })
-            except:
-                pass  # Ignore les erreurs de bus pour ne pas casser le workflow
+            # Publier événement de monitoring (asynchrone, sans bloquer la génération)
+            self._event_q.put_nowait({
+                "name": "skin.create",
+                "state": "request",
+                "payload": {
+                    "source_path": source_str,
+                    "target_path": skin_str,
+                    "requester": "fx_manager"
+                }
+            })
             
             # Récupérer les paramètres skin depuis la config
-            skin_params = self._get_skin_params_from_config()
+            skin_params, params_digest = self._get_skin_params_and_digest()
+            
+            # Même brut + mêmes paramètres déjà traités : réutiliser sans refaire le DSP
+            cached_skin = self._skin_cache_path(source_str, params_digest)
+            key_path = skin_path.with_name(_SKIN_KEY_NAME)
+            if os.path.isfile(cached_skin):
+                self._link_or_copy(cached_skin, skin_path)
+                self._write_skin_key(key_path, skin_path, cached_skin.stem)
+                if pol.enabled(1):
+                    pol.write(1, f"⚡ Skin en cache réutilisé: {_SKIN_NAME}", mode="log")
+                return True
+            
+            # Détacher un éventuel lien vers une autre entrée du cache avant réécriture
+            for stale in (key_path, skin_path):
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
             
             # Déléguer au processor
             processor = self._get_processor()
-            success = processor.apply_skin_effects(str(source), str(skin_path), skin_params)
+            success = processor.apply_skin_effects(source_str, skin_str, skin_params)
             
             if success:
-                pol.write(1, f"✅ Skin créé: {skin_path.name}", mode="log")
+                if pol.enabled(1):
+                    pol.write(1, f"✅ Skin créé: {_SKIN_NAME}", mode="log")
+                try:
+                    self._write_skin_key(key_path, skin_path, cached_skin.stem)
+                    _SKIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    self._link_or_copy(skin_path, cached_skin)
+                    _prune_skin_cache()
+                except OSError as e:
+                    pol.write(2, f"⚠️ Skin non mis en cache: {e}", mode="log")
             else:
-                pol.write(3, f"❌ Échec création skin: {skin_path.name}", mode="log+print")
+                pol.write(3, f"❌ Échec création skin: {_SKIN_NAME}", mode="log+print")
 
             return success
             
         except Exception as e:
-            pol.write(3, f"❌ Erreur create_skin_for: {e}", mode="log+print")
-            import traceback
-            traceback.print_exc()
+            _log_exception("create_skin_for", e)
             return False
     
     def create_for(self, source_path: str, effects: Union[str, List[str]] = "all") -> bool:
@@ -116,42 +299,39 @@ class FXManager:
             bool: True si succès global
         """
         try:
-            source = Path(source_path)
+            source, source_str, parent_str, _, skin_str = _resolve_paths(source_path)
             
-            if not source.exists():
+            if not os.path.isfile(source_path):
                 pol.write(3, f"❌ Fichier source introuvable: {source}", mode="log+print")
                 return False
             
-            # Publier événement de monitoring (bus fragile, on protège)
-            try:
-                self.event_bus.publish({
-                    "name": "fx.create_for",
-                    "state": "request",
-                    "payload": {
-                        "source_path": str(source),
-                        "effects": effects,
-                        "requester": "fx_manager"
-                    }
-                })
-            except:
-                pass  # Ignore les erreurs de bus
+            # Publier événement de monitoring (asynchrone, sans bloquer la génération)
+            self._event_q.put_nowait({
+                "name": "fx.create_for",
+                "state": "request",
+                "payload": {
+                    "source_path": source_str,
+                    "effects": effects,
+                    "requester": "fx_manager"
+                }
+            })
             
-            # Résoudre la liste d'effets
-            effects_list = self._resolve_effects_list(effects)
+            # Résoudre la liste d'effets (plan mémorisé par demande : effets + fichiers cibles)
+            effects_list, target_names = self._plan(effects)
             
-            pol.write(1, f"🎛️ Création effets pour {source.name}: {effects_list}", mode="log")
+            if pol.enabled(1):
+                pol.write(1, f"🎛️ Création effets pour {source.name}: {effects_list}", mode="log")
 
             # === ÉTAPE 1 : S'assurer que skin.wav existe ===
-            skin_path = source.parent / "skin.wav"
-            
-            if not skin_path.exists() or self._skin_needs_regeneration(skin_path):
+            if not os.path.isfile(skin_str) or self._skin_needs_regeneration(skin_str, source_str):
                 print("🎨 Génération skin nécessaire...")
-                skin_success = self.create_skin_for(str(source))
+                skin_success = self.create_skin_for(source_str)
                 if not skin_success:
                     print("❌ Impossible de créer le skin, abandon")
                     return False
             else:
-                pol.write(1, f"⚡ Skin existant utilisé: {skin_path.name}", mode="log")
+                if pol.enabled(1):
+                    pol.write(1, f"⚡ Skin existant utilisé: {_SKIN_NAME}", mode="log")
             
             # === ÉTAPE 2 : Générer les effets environment depuis skin ===
             if effects == "none":
@@ -159,58 +339,122 @@ class FXManager:
                 return True
             
             processor = self._get_processor()
-            success_count = 0
             total_effects = len(effects_list)
             
-            for effect in effects_list:
-                target_path = source.parent / f"{effect}.wav"
-                pol.write(1, f"🌍 Génération {effect}: {skin_path.name} → {target_path.name}", mode="log")
-                
-                success = processor.apply_environment_effect(str(skin_path), str(target_path), effect)
-                
-                if success:
-                    success_count += 1
-                    pol.write(1, f"✅ Effet {effect} créé", mode="log")
-                else:
-                    pol.write(3, f"❌ Échec effet {effect}", mode="log+print")
+            if total_effects > 1:
+                # Plusieurs effets : programmés ensemble, skin.wav décodé une seule fois par le FX Generator
+                success_count = self._create_environments(processor, skin_str, parent_str, effects_list, target_names)
+            else:
+                success_count = sum(
+                    1 for effect, name in zip(effects_list, target_names)
+                    if self._create_environment(processor, skin_str, parent_str, effect, name)
+                )
 
             # Résultat global
             if success_count == total_effects:
-                pol.write(1, f"✅ Tous les effets créés ({success_count}/{total_effects})", mode="log")
+                if pol.enabled(1):
+                    pol.write(1, f"✅ Tous les effets créés ({success_count}/{total_effects})", mode="log")
                 return True
             elif success_count > 0:
-                pol.write(1, f"⚠️ Succès partiel ({success_count}/{total_effects})", mode="log")
+                if pol.enabled(1):
+                    pol.write(1, f"⚠️ Succès partiel ({success_count}/{total_effects})", mode="log")
                 return True
             else:
                 pol.write(3, f"❌ Aucun effet créé (0/{total_effects})", mode="log+print")
                 return False
                 
         except Exception as e:
-            pol.write(3, f"❌ Erreur create_for: {e}", mode="log+print")
-            import traceback
-            traceback.print_exc()
+            _log_exception("create_for", e)
             return False
     
-    def _resolve_effects_list(self, effects: Union[str, List[str]]) -> List[str]:
-        """Résout la liste d'effets selon la demande"""
+    def _create_environment(self, processor, skin_str: str, parent_str: str, effect: str, name: str) -> bool:
+        """Génère un effet environment (fichier name dans parent_str) depuis skin.wav"""
+        try:
+            if pol.enabled(1):
+                pol.write(1, f"🌍 Génération {effect}: {_SKIN_NAME} → {name}", mode="log")
+            
+            success = processor.apply_environment_effect(skin_str, os.path.join(parent_str, name), effect)
+            
+            if success:
+                if pol.enabled(1):
+                    pol.write(1, f"✅ Effet {effect} créé", mode="log")
+            else:
+                pol.write(3, f"❌ Échec effet {effect}", mode="log+print")
+            return success
         
-        available_effects = ["ship", "city", "helmet"]
+        except Exception as e:
+            pol.write(3, f"❌ Erreur effet {effect}: {e}", mode="log+print")
+            return False
+    
+    def _create_environments(self, processor, skin_str: str, parent_str: str, effects_list: Tuple[str, ...], target_names: Tuple[str, ...]) -> int:
+        """
+        Génère plusieurs effets environment depuis skin.wav en un seul lot
+        
+        Returns:
+            int: Nombre d'effets créés
+        """
+        try:
+            targets = [(effect, os.path.join(parent_str, name)) for effect, name in zip(effects_list, target_names)]
+            if pol.enabled(1):
+                for effect, name in zip(effects_list, target_names):
+                    pol.write(1, f"🌍 Génération {effect}: {_SKIN_NAME} → {name}", mode="log")
+            
+            results = processor.apply_environment_effects_batch(skin_str, targets)
+            
+            success_count = 0
+            for effect in effects_list:
+                if results.get(effect):
+                    success_count += 1
+                    if pol.enabled(1):
+                        pol.write(1, f"✅ Effet {effect} créé", mode="log")
+                else:
+                    pol.write(3, f"❌ Échec effet {effect}", mode="log+print")
+            return success_count
+        
+        except Exception as e:
+            pol.write(3, f"❌ Erreur effets {effects_list}: {e}", mode="log+print")
+            return 0
+    
+    def _plan(self, effects: Union[str, List[str]]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """(effets résolus, noms des fichiers cibles) pour une demande, mémorisé par _effects_plan"""
+        # Cas le plus courant : tous les effets, plan fixe sans recherche
+        if effects is ALL:
+            return self._ALL_PLAN
+        key = tuple(effects) if type(effects) is list else effects
+        try:
+            return _effects_plan(key)
+        except TypeError:
+            # Demande non hashable : résolution directe (hors cache)
+            resolved = tuple(self._resolve_effects_list(effects))
+            return resolved, tuple(f"{e}.wav" for e in resolved)
+    
+    @classmethod
+    def _resolve_effects_list(cls, effects: Union[str, List[str]]) -> List[str]:
+        """Résout la liste d'effets selon la demande"""
         
         if effects == "all":
-            return available_effects
+            return list(cls._AVAILABLE_EFFECTS)
         elif effects == "none":
             return []
-        elif isinstance(effects, list):
+        elif isinstance(effects, (list, tuple)):
             # Filtrer les effets valides
-            return [e for e in effects if e in available_effects]
-        elif isinstance(effects, str) and effects in available_effects:
+            return [e for e in effects if e in cls._AVAILABLE_SET]
+        elif isinstance(effects, str) and effects in cls._AVAILABLE_SET:
             return [effects]
         else:
             pol.write(3, f"⚠️ Effets non reconnus: {effects}, utilisation par défaut", mode="log+print")
-            return available_effects
+            return list(cls._AVAILABLE_EFFECTS)
     
     def _get_skin_params_from_config(self) -> Dict[str, Any]:
-        """Récupère les paramètres skin depuis la configuration"""
+        """Récupère les paramètres skin depuis la configuration (en cache jusqu'au prochain changement de config)"""
+        return self._get_skin_params_and_digest()[0]
+    
+    def _get_skin_params_and_digest(self) -> Tuple[Dict[str, Any], bytes]:
+        """Paramètres skin et empreinte sha256 de leur forme JSON canonique (calculés une fois par config)"""
+        cached = self._skin_params_cache
+        if cached is not None:
+            return cached
+        
         params = {
             "pitch": self.config_manager.get("effects.skin.pitch", 0),
             "speed": self.config_manager.get("effects.skin.speed", 0),
@@ -226,17 +470,83 @@ class FXManager:
         }
         
         # ✅ DEBUG : Voir EXACTEMENT ce qui est lu
-        pol.write(1, f"🔍 DEBUG config lue: {params}", mode="log")
-        return params
+        if pol.enabled(4):
+            pol.write(4, f"🔍 DEBUG config lue: {params}", mode="log")
+        canon = json.dumps(params, sort_keys=True, separators=(",", ":")).encode('utf-8')
+        cached = (params, hashlib.sha256(canon).digest())
+        self._skin_params_cache = cached
+        return cached
     
-    def _skin_needs_regeneration(self, skin_path: Path) -> bool:
+    def _skin_needs_regeneration(self, skin_path: Union[str, Path], source: Union[str, Path]) -> bool:
         """
         Vérifie si le skin doit être régénéré
         
-        Pour l'instant, toujours False (on fait confiance au cache)
-        TODO: Comparer timestamp config vs fichier
+        Le skin est à jour si sa fiche skin.key porte la clé du cache correspondant au
+        contenu de la source et aux paramètres skin actuels, et si skin.wav n'a pas été
+        réécrit depuis (même taille, même mtime). Indépendant du lien dur ou de la copie.
         """
-        return False
+        try:
+            cached_skin = self._skin_cache_path(source, self._get_skin_params_and_digest()[1])
+            with open(os.path.join(os.path.dirname(skin_path), _SKIN_KEY_NAME), encoding='utf-8') as f:
+                recorded = f.read()
+            st = os.stat(skin_path)
+            return recorded != f"{cached_skin.stem} {st.st_size} {st.st_mtime_ns}"
+        except OSError:
+            return True  # Pas de fiche (skin antérieur ou échec) : régénérer une fois
+    
+    @staticmethod
+    def _write_skin_key(key_path: Path, skin_path: Path, cache_key: str):
+        """Enregistre à côté de skin.wav la clé du cache dont il provient, avec sa taille et son mtime"""
+        st = os.stat(skin_path)
+        key_path.write_text(f"{cache_key} {st.st_size} {st.st_mtime_ns}", encoding='utf-8')
+    
+    def _skin_cache_path(self, source: Union[str, Path], params_digest: bytes) -> Path:
+        """Chemin du skin en cache pour (contenu de la source, empreinte des paramètres skin)"""
+        h = hashlib.sha256(self._source_digest(source))
+        h.update(params_digest)
+        return _SKIN_CACHE_DIR / f"{h.hexdigest()}.wav"
+    
+    def _source_digest(self, source: Union[str, Path]) -> bytes:
+        """Empreinte sha256 du contenu de la source, recalculée seulement si le fichier a changé"""
+        st = os.stat(source)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = os.fspath(source)
+        
+        with self._source_digests_lock:
+            cached = self._source_digests.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._source_digests.move_to_end(key)
+                return cached[1]
+        
+        h = hashlib.sha256()
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+                h.update(chunk)
+        digest = h.digest()
+        
+        with self._source_digests_lock:
+            self._source_digests[key] = (stamp, digest)
+            self._source_digests.move_to_end(key)
+            while len(self._source_digests) > _SOURCE_DIGEST_MAX:
+                self._source_digests.popitem(last=False)
+        return digest
+    
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path):
+        """Remplace dst par src : lien dur si possible, sinon copie"""
+        tmp = dst.with_name(f"{dst.name}.{threading.get_ident()}.tmp")
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+
+
+@functools.lru_cache(maxsize=16)
+def _effects_plan(effects_key) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Plan d'une demande d'effets ("all", "ship", tuple...) : effets résolus et fichiers cibles"""
+    resolved = tuple(FXManager._resolve_effects_list(effects_key))
+    return resolved, tuple(f"{e}.wav" for e in resolved)
 
 
 def get_fx_manager(config_manager, event_bus) -> FXManager:
@@ -252,6 +562,11 @@ def get_fx_manager(config_manager, event_bus) -> FXManager:
     """
     global _fx_manager_instance
     
+    # Chemin rapide sans verrou : l'instance n'est plus modifiée une fois créée
+    instance = _fx_manager_instance
+    if instance is not None:
+        return instance
+    
     with _fx_manager_lock:
         if _fx_manager_instance is None:
             _fx_manager_instance = FXManager(config_manager, event_bus)
@@ -11,27 +11,179 @@ Utilise FFmpeg en priorité avec fallback numpy.
 
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import shutil
 import subprocess
 import tempfile
 import numpy as np
 from core.config.manager import ConfigManager
 from core.bus import EventBus
 
+def _join_filter_chain(filters: List[Tuple[str, str]]) -> str:
+    """
+    Assemble la chaîne -af à partir des (type, paramètres) collectés
+    
+    Un seul aresample=24000 ferme la partie qui modifie la fréquence : placé juste
+    après asetrate, ou après atempo quand les deux sont présents (atempo accepte
+    n'importe quelle fréquence), puis les filtres passe-haut/passe-bas travaillent à 24 kHz.
+    """
+    nodes = [f"{name}={params}" for name, params in filters]
+    if filters and filters[0][0] == "asetrate":
+        rate_end = 2 if len(filters) > 1 and filters[1][0] == "atempo" else 1
+        nodes.insert(rate_end, "aresample=24000")
+    return ",".join(nodes)
+
+# Threads de filtrage FFmpeg (un par cœur)
+_FFMPEG_THREADS = str(os.cpu_count() or 1)
+
+# Au-delà de cette taille (octets), la chaîne de filtres est passée à FFmpeg par fichier
+_FILTER_SCRIPT_MIN = 4096
+
+@lru_cache(maxsize=128)
+def _build_skin_filtergraph(skin_items: Tuple[Tuple[str, Any], ...]) -> Tuple[str, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Construit la chaîne FFmpeg des effets skin (mémorisée par jeu de paramètres)
+    
+    Args:
+        skin_items: tuple(sorted(skin_params.items()))
+        
+    Returns:
+        (chaîne -af des effets de transformation, effets additifs, lignes de description)
+    """
+    params = dict(skin_items)
+    
+    # Extraire les paramètres skin
+    pitch = params.get("pitch", 0)
+    speed = params.get("speed", 0)
+    highpass = params.get("highpass", 0)  # ← NOUVEAU
+    lowpass = params.get("lowpass", 0)    # ← NOUVEAU
+    metallic = params.get("metallic", 0)
+    distortion = params.get("distortion", 0)
+    reverb = params.get("reverb", 0)
+    echo = params.get("echo", 0)
+    vocoder = params.get("vocoder", 0)
+    hash = params.get("hash", 0)
+    dry_wet = params.get("dry_wet", 100)
+
+    # Construire la chaîne de filtres FFmpeg
+    details = []           # Lignes de description (affichées en debug)
+    base_filters = []      # Effets de transformation (100%) - (type, paramètres) pour pitch, speed, highpass, lowpass
+    additive_filters = []  # Effets additifs (dry_wet) - reverb, echo, distortion, metallic
+
+    # === PITCH SHIFTING (TRANSFORMATION 100%) ===
+    if pitch != 0:
+        # Pitch en demi-tons (-12 à +12)
+        pitch_ratio = 2 ** (pitch / 12.0)
+        base_filters.append(("asetrate", f"24000*{pitch_ratio:.3f}"))
+        details.append(f"   🎵 Pitch: {pitch} demi-tons (ratio: {pitch_ratio:.3f})")
+
+    # === SPEED CHANGE (TRANSFORMATION 100%) ===
+    if speed != 0:
+        # Convertir % en ratio (speed=50 = 1.5x plus rapide)
+        speed_ratio = 1.0 + (speed / 100.0)
+        if speed_ratio > 0.1:  # Éviter les valeurs trop extrêmes
+            base_filters.append(("atempo", f"{speed_ratio:.3f}"))
+            details.append(f"   ⚡ Vitesse: {speed}% (ratio: {speed_ratio:.3f})")
+
+    # === FILTRE PASSE-HAUT (TRANSFORMATION 100%) ===
+    if highpass > 0:
+        highpass_freq = 200 + (highpass * 22)  # 200Hz à 2400Hz
+        base_filters.append(("highpass", f"f={highpass_freq}"))
+        details.append(f"   📈 Passe-haut: {highpass}% (coupure: {highpass_freq}Hz)")
+
+    # === FILTRE PASSE-BAS (TRANSFORMATION 100%) ===
+    if lowpass > 0:
+        lowpass_freq = 4000 - (lowpass * 35)   # 4000Hz à 500Hz
+        if lowpass_freq < 300: lowpass_freq = 300  # Plancher plus réaliste
+        base_filters.append(("lowpass", f"f={lowpass_freq}"))
+        details.append(f"   📉 Passe-bas: {lowpass}% (coupure: {lowpass_freq}Hz)")
+
+    # === EFFET METALLIC (ADDITIF - DRY/WET) ===
+    if metallic > 0:
+        additive_filters.append(f"equalizer=f=3000:t=q:w=1:g={metallic}")
+        details.append(f"   🤖 Metallic: {metallic}% (gain: {metallic}dB)")
+
+    # === DISTORTION (ADDITIF - DRY/WET) ===
+    if distortion > 0:
+        # Utiliser un filtre supporté : amplification + compression
+        drive_db = 1 + (distortion * 0.2)  # 1dB à 21dB
+        # Utiliser volume + acompressor au lieu d'overdrive
+        additive_filters.append(f"volume={drive_db:.1f}dB")
+        if distortion > 30:  # Compression forte pour distortion élevée
+            additive_filters.append("acompressor=threshold=-10dB:ratio=4:attack=5:release=50")
+        details.append(f"   🎸 Distortion: {distortion}% (gain: {drive_db:.1f}dB)")
+
+    # === VOCODER (NOUVEAU) ===
+    if vocoder > 0:
+        # Simulation vocoder avec modulation d'amplitude à basse fréquence
+        vocoder_freq = 2 + (vocoder * 0.1)  # 2Hz à 12Hz
+        vocoder_depth = 0.3 + (vocoder * 0.007)  # 0.3 à 1.0
+        additive_filters.append(f"tremolo=f={vocoder_freq:.1f}:d={vocoder_depth:.2f}")
+        details.append(f"   🎛️ Vocoder: {vocoder}% (freq: {vocoder_freq:.1f}Hz, depth: {vocoder_depth:.2f})")
+
+    # === HASH / DEGRADATION DIGITALE (NOUVEAU) ===
+    if hash > 0:
+        # Simulation dégradation : downsampling + bitcrush via decimator
+        decimation = 1 + int(hash * 0.08)  # 1x à 8x decimation
+        if decimation > 1:
+            additive_filters.append(f"asamplefmt=s16:sample_rate=24000")  # Force 16-bit
+            # Simuler bitcrush avec quantization
+            additive_filters.append(f"volume=0.{100-hash}")  # Réduction dynamique
+            details.append(f"   📱 Hash: {hash}% (degradation: {decimation}x)")
+
+    # === ECHO (AJUSTER AMPLITUDES) ===
+    if echo > 0:
+        # Amplitudes plus fines pour l'écho
+        echo_delay = 50 + (echo * 5)         # 50ms à 550ms (plus court)
+        echo_gain = 0.05 + (echo * 0.004)   # 0.05 à 0.45 (plus subtil)
+        additive_filters.append(f"aecho=0.8:0.88:{int(echo_delay)}:{echo_gain:.3f}")
+        details.append(f"   📢 Echo: {echo}% (delay: {echo_delay:.0f}ms, gain: {echo_gain:.3f})")
+
+    # === REVERB (AJUSTER AMPLITUDES) ===
+    if reverb > 0:
+        # Amplitudes plus fines pour la réverbération
+        reverb_time = 0.05 + (reverb * 0.015)   # 0.05s à 1.55s (plus court)
+        reverb_decay = 0.1 + (reverb * 0.004)   # 0.1 à 0.5 (plus subtil)
+        additive_filters.append(f"aecho=0.8:0.9:800|1200:{reverb_decay:.3f}|{reverb_decay*0.6:.3f}")
+        details.append(f"   🏛️ Reverb: {reverb}% (time: {reverb_time:.2f}s, decay: {reverb_decay:.3f})")
+
+    return _join_filter_chain(base_filters), tuple(additive_filters), tuple(details)
+
 class FXProcessor:
     """Processeur unifié pour tous les effets audio"""
     
     def __init__(self, config_manager: ConfigManager, event_bus: EventBus):
         self.config_manager = config_manager
         self.event_bus = event_bus
+        self._ffmpeg = "ffmpeg"  # Chemin résolu par prepare()
+        # Paramètres effects.skin.* lus une fois, vidés à chaque sauvegarde/rechargement de la config
+        self._skin_cfg = self._load_skin_cfg()
+        self.event_bus.subscribe(self._on_bus_event)
         
         if self._get_config_value("debug_sw", False): print("🔧 FXProcessor initialisé")
     
+    def _on_bus_event(self, message):
+        """Vide le cache des paramètres skin sur sauvegarde/rechargement de la config"""
+        if message.get("name") == "config" and message.get("state") in ("saved", "reloaded"):
+            self._skin_cfg = None
+    
+    def prepare(self):
+        """
+        Prépare le processeur avant le premier effet
+        
+        Résout une fois le chemin de FFmpeg (évite la recherche dans le PATH à chaque appel).
+        Le FX Generator reste créé à la demande (get_fx_generator).
+        """
+        self._ffmpeg = shutil.which("ffmpeg") or "ffmpeg"
+    
     def apply_skin_effects(self, source_path: str, target_path: str, skin_params: dict) -> bool:
         """Applique les effets skin depuis brut.wav vers skin.wav avec FFmpeg"""
         try:
             # ✅ DEBUG : Afficher TOUS les paramètres reçus
-            if self._get_config_value("debug_sw", False): print(f"🔍 DEBUG skin_params REÇUS: {skin_params}")
+            debug = self._get_config_value("debug_sw", False)
+            if debug: print(f"🔍 DEBUG skin_params REÇUS: {skin_params}")
             
             source = Path(source_path)
             target = Path(target_path)
@@ -43,127 +195,55 @@ class FXProcessor:
             # Créer le dossier parent si nécessaire
             target.parent.mkdir(parents=True, exist_ok=True)
             
-            # Extraire les paramètres skin
-            pitch = skin_params.get("pitch", 0)
-            speed = skin_params.get("speed", 0)
-            highpass = skin_params.get("highpass", 0)  # ← NOUVEAU
-            lowpass = skin_params.get("lowpass", 0)    # ← NOUVEAU
-            metallic = skin_params.get("metallic", 0)
-            distortion = skin_params.get("distortion", 0)
-            reverb = skin_params.get("reverb", 0)
-            echo = skin_params.get("echo", 0)
-            vocoder = skin_params.get("vocoder", 0)
-            hash = skin_params.get("hash", 0)
-            dry_wet = skin_params.get("dry_wet", 100)
-
-            if self._get_config_value("debug_sw", False): print(f"🎛️ Effets skin: pitch={pitch}, speed={speed}, highpass={highpass}, lowpass={lowpass}, metallic={metallic}, dry_wet={dry_wet}, distortion={distortion}, reverb={reverb}, echo={echo}, vocoder={vocoder}, hash={hash}")
-
-            # Construire la chaîne de filtres FFmpeg
-            base_filters = []      # Effets de transformation (100%) - pitch, speed, highpass, lowpass
-            additive_filters = []  # Effets additifs (dry_wet) - reverb, echo, distortion, metallic
-            
-            # === PITCH SHIFTING (TRANSFORMATION 100%) ===
-            if pitch != 0:
-                # Pitch en demi-tons (-12 à +12)
-                pitch_ratio = 2 ** (pitch / 12.0)
-                base_filters.append(f"asetrate=24000*{pitch_ratio:.3f},aresample=24000")
-                print(f"   🎵 Pitch: {pitch} demi-tons (ratio: {pitch_ratio:.3f})")
-            
-            # === SPEED CHANGE (TRANSFORMATION 100%) ===
-            if speed != 0:
-                # Convertir % en ratio (speed=50 = 1.5x plus rapide)
-                speed_ratio = 1.0 + (speed / 100.0)
-                if speed_ratio > 0.1:  # Éviter les valeurs trop extrêmes
-                    base_filters.append(f"atempo={speed_ratio:.3f}")
-                    print(f"   ⚡ Vitesse: {speed}% (ratio: {speed_ratio:.3f})")
-            
-            # === FILTRE PASSE-HAUT (TRANSFORMATION 100%) ===
-            if highpass > 0:
-                highpass_freq = 200 + (highpass * 22)  # 200Hz à 2400Hz
-                base_filters.append(f"highpass=f={highpass_freq}")
-                print(f"   📈 Passe-haut: {highpass}% (coupure: {highpass_freq}Hz)")
-                
-            # === FILTRE PASSE-BAS (TRANSFORMATION 100%) ===
-            if lowpass > 0:
-                lowpass_freq = 4000 - (lowpass * 35)   # 4000Hz à 500Hz
-                if lowpass_freq < 300: lowpass_freq = 300  # Plancher plus réaliste
-                base_filters.append(f"lowpass=f={lowpass_freq}")
-                print(f"   📉 Passe-bas: {lowpass}% (coupure: {lowpass_freq}Hz)")
-                
-            # === EFFET METALLIC (ADDITIF - DRY/WET) ===
-            if metallic > 0:
-                additive_filters.append(f"equalizer=f=3000:t=q:w=1:g={metallic}")
-                print(f"   🤖 Metallic: {metallic}% (gain: {metallic}dB)")
-
-            # === DISTORTION (ADDITIF - DRY/WET) ===
-            if distortion > 0:
-                # Utiliser un filtre supporté : amplification + compression
-                drive_db = 1 + (distortion * 0.2)  # 1dB à 21dB
-                # Utiliser volume + acompressor au lieu d'overdrive
-                additive_filters.append(f"volume={drive_db:.1f}dB")
-                if distortion > 30:  # Compression forte pour distortion élevée
-                    additive_filters.append("acompressor=threshold=-10dB:ratio=4:attack=5:release=50")
-                print(f"   🎸 Distortion: {distortion}% (gain: {drive_db:.1f}dB)")
-            
-            # === VOCODER (NOUVEAU) ===
-            if vocoder > 0:
-                # Simulation vocoder avec modulation d'amplitude à basse fréquence
-                vocoder_freq = 2 + (vocoder * 0.1)  # 2Hz à 12Hz
-                vocoder_depth = 0.3 + (vocoder * 0.007)  # 0.3 à 1.0
-                additive_filters.append(f"tremolo=f={vocoder_freq:.1f}:d={vocoder_depth:.2f}")
-                print(f"   🎛️ Vocoder: {vocoder}% (freq: {vocoder_freq:.1f}Hz, depth: {vocoder_depth:.2f})")
-            
-            # === HASH / DEGRADATION DIGITALE (NOUVEAU) ===
-            if hash > 0:
-                # Simulation dégradation : downsampling + bitcrush via decimator
-                decimation = 1 + int(hash * 0.08)  # 1x à 8x decimation
-                if decimation > 1:
-                    additive_filters.append(f"asamplefmt=s16:sample_rate=24000")  # Force 16-bit
-                    # Simuler bitcrush avec quantization
-                    additive_filters.append(f"volume=0.{100-hash}")  # Réduction dynamique
-                    print(f"   📱 Hash: {hash}% (degradation: {decimation}x)")
-            
-            # === ECHO (AJUSTER AMPLITUDES) ===
-            if echo > 0:
-                # Amplitudes plus fines pour l'écho
-                echo_delay = 50 + (echo * 5)         # 50ms à 550ms (plus court)
-                echo_gain = 0.05 + (echo * 0.004)   # 0.05 à 0.45 (plus subtil)
-                additive_filters.append(f"aecho=0.8:0.88:{int(echo_delay)}:{echo_gain:.3f}")
-                print(f"   📢 Echo: {echo}% (delay: {echo_delay:.0f}ms, gain: {echo_gain:.3f})")
+            # Détacher la cible : elle peut être un lien dur vers une entrée du cache skin,
+            # FFmpeg la tronquerait et écraserait cette entrée
+            try:
+                target.unlink()
+            except FileNotFoundError:
+                pass
             
-            # === REVERB (AJUSTER AMPLITUDES) ===
-            if reverb > 0:
-                # Amplitudes plus fines pour la réverbération
-                reverb_time = 0.05 + (reverb * 0.015)   # 0.05s à 1.55s (plus court)
-                reverb_decay = 0.1 + (reverb * 0.004)   # 0.1 à 0.5 (plus subtil)
-                additive_filters.append(f"aecho=0.8:0.9:800|1200:{reverb_decay:.3f}|{reverb_decay*0.6:.3f}")
-                print(f"   🏛️ Reverb: {reverb}% (time: {reverb_time:.2f}s, decay: {reverb_decay:.3f})")
+            # Construire (ou retrouver) la chaîne de filtres FFmpeg pour ces paramètres
+            base_chain, additive_filters, details = _build_skin_filtergraph(tuple(sorted(skin_params.items())))
+            if debug:
+                print(f"🎛️ Effets skin: {skin_params}")
+                for line in details:
+                    print(line)
             
             # === LOGIQUE SIMPLIFIÉE TEMPORAIRE (éviter les erreurs FFmpeg) ===
             # Appliquer SEULEMENT base_filters pour éviter les problèmes de syntaxe
             
-            if base_filters:
+            script_path = None
+            if base_chain:
                 # Seulement pitch/speed/filtres (pas d'écho garanti)
-                base_chain = ",".join(base_filters)
+                filter_args = ["-af", base_chain]
+                if len(base_chain) > _FILTER_SCRIPT_MIN:
+                    # Chaîne longue : passée par fichier (limite de taille de la ligne de commande)
+                    with tempfile.NamedTemporaryFile("w", suffix=".filter", delete=False, encoding="utf-8") as f:
+                        f.write(base_chain)
+                    script_path = f.name
+                    filter_args = ["-filter_script:a", script_path]
                 cmd = [
-                    "ffmpeg", "-y",
+                    self._ffmpeg, "-y",
+                    "-filter_threads", _FFMPEG_THREADS,  # Filtres répartis sur les cœurs disponibles
                     "-i", str(source),
-                    "-af", base_chain,
+                    *filter_args,
                     "-acodec", "pcm_s16le",
                     "-ar", "24000",
                     "-ac", "1",
+                    "-threads", "0",  # Nombre de threads choisi par FFmpeg
                     str(target)
                 ]
                 print(f"🔧 FFmpeg base seulement: {base_chain}")
                 # TODO: Implémenter dry_wet pour additive_filters plus tard
                 if additive_filters:
-                    print(f"⚠️ Effets additifs ignorés temporairement: {additive_filters}")
+                    print(f"⚠️ Effets additifs ignorés temporairement: {list(additive_filters)}")
                 
             else:
                 # Aucun effet
                 print("   ℹ️ Aucun effet → Copie simple")
-                import shutil
-                shutil.copy2(source, target)
+                # Vraie copie (jamais de lien dur) : skin.wav ne doit pas partager l'inode de brut.wav,
+                # il est ensuite lié dans le cache skin indexé par le contenu de la source
+                shutil.copyfile(source, target)
                 return True
 
             # Exécuter la commande FFmpeg
@@ -185,6 +265,12 @@ class FXProcessor:
             except Exception as e:
                 print(f"❌ Erreur subprocess FFmpeg: {e}")
                 return False
+            finally:
+                if script_path is not None:
+                    try:
+                        os.unlink(script_path)
+                    except OSError:
+                        pass
                 
         except Exception as e:
             print(f"❌ Erreur apply_skin_effects: {e}")
@@ -212,30 +298,19 @@ class FXProcessor:
                 return False
             
             # Utiliser le FX Generator existant
-            from core.sound.fx_generator import fx_generator
+            from core.sound.fx_generator import get_fx_generator
             
-            # ✅ FIX: Appel simplifié sans Priority
-            success = fx_generator.create_async(str(source), effect, force_remake=True)
-            
-            if not success:
-                print(f"❌ Échec programmation effet {effect}")
-                return False
-            
-            # ✅ ATTENDRE que le fichier soit généré (polling simple)
-            import time
+            # ✅ ATTENDRE la fin du job (signal du FX Generator, pas de polling)
             max_wait = 15  # 15 secondes max
-            wait_time = 0
-
+            
             if self._get_config_value("debug_sw", False): print(f"⏳ Attente génération {effect} (max {max_wait}s)...")
-            while not target.exists() and wait_time < max_wait:
-                time.sleep(0.5)
-                wait_time += 0.5
+            done = get_fx_generator().create_and_wait(str(source), [effect], force_remake=True, timeout=max_wait)
             
-            if target.exists() and target.stat().st_size > 0:
+            if done[effect] and target.exists() and target.stat().st_size > 0:
                 print(f"✅ Environment {effect} généré: {target.name}")
                 return True
             else:
-                print(f"❌ Timeout génération {effect} après {max_wait}s")
+                print(f"❌ Échec ou timeout génération {effect} (max {max_wait}s)")
                 return False
             
         except Exception as e:
@@ -244,6 +319,54 @@ class FXProcessor:
             traceback.print_exc()
             return False
 
+    def apply_environment_effects_batch(self, source_path: str, targets: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Applique plusieurs effets environment depuis un même skin.wav
+        
+        Les effets sont programmés en un seul lot : le FX Generator décode skin.wav
+        une fois et le partage entre ses workers.
+        
+        Args:
+            source_path: Chemin vers skin.wav
+            targets: Liste de (effet, chemin de sortie), ex: [("ship", ".../ship.wav")]
+            
+        Returns:
+            Dict[str, bool]: Succès par effet
+        """
+        results = {effect: False for effect, _ in targets}
+        try:
+            source = Path(source_path)
+            effects = [effect for effect, _ in targets]
+            
+            print(f"🌍 Application environments {effects}: {source.name}")
+            
+            if not source.exists():
+                print(f"❌ Fichier source introuvable: {source}")
+                return results
+            
+            from core.sound.fx_generator import get_fx_generator
+            
+            # ✅ ATTENDRE la fin des jobs du lot (signal du FX Generator, pas de polling)
+            max_wait = 15  # 15 secondes max
+            
+            if self._get_config_value("debug_sw", False): print(f"⏳ Attente génération {effects} (max {max_wait}s)...")
+            done = get_fx_generator().create_and_wait(str(source), effects, force_remake=True, timeout=max_wait)
+            
+            for effect, target_str in targets:
+                target = Path(target_str)
+                if done[effect] and target.exists() and target.stat().st_size > 0:
+                    results[effect] = True
+                    print(f"✅ Environment {effect} généré: {target.name}")
+                else:
+                    print(f"❌ Échec ou timeout génération {effect} (max {max_wait}s)")
+            return results
+            
+        except Exception as e:
+            print(f"❌ Erreur apply_environment_effects_batch: {e}")
+            import traceback
+            traceback.print_exc()
+            return results
+
     def _get_config_value(self, key: str, default: int) -> int:
         """
         Récupère la valeur d'un paramètre de configuration avec une valeur par défaut.
@@ -264,23 +387,30 @@ class FXProcessor:
         else:
             return default
 
+    def _load_skin_cfg(self) -> Dict[str, int]:
+        """Lit les paramètres skin (effects.skin.*) dans la configuration"""
+        return {
+            "pitch": self._get_config_value("effects.skin.pitch", 0),
+            "speed": self._get_config_value("effects.skin.speed", 0),
+            "highpass": self._get_config_value("effects.skin.highpass", 0),
+            "metallic": self._get_config_value("effects.skin.metallic", 0),
+            "lowpass": self._get_config_value("effects.skin.lowpass", 0),
+            "distortion": self._get_config_value("effects.skin.distortion", 0),
+            "reverb": self._get_config_value("effects.skin.reverb", 0),
+            "echo": self._get_config_value("effects.skin.echo", 0),
+            "vocoder": self._get_config_value("effects.skin.vocoder", 0),
+            "hash": self._get_config_value("effects.skin.hash", 0),
+            "dry_wet": self._get_config_value("effects.skin.dry_wet", 100)
+        }
+
     def apply_skin_effects_with_config(self, source_path: str, target_path: str) -> bool:
         """Applique les effets skin en utilisant les valeurs de configuration"""
         try:
-            # Extraire les paramètres skin depuis la configuration
-            skin_params = {
-                "pitch": self._get_config_value("effects.skin.pitch", 0),
-                "speed": self._get_config_value("effects.skin.speed", 0),
-                "highpass": self._get_config_value("effects.skin.highpass", 0),
-                "metallic": self._get_config_value("effects.skin.metallic", 0),
-                "lowpass": self._get_config_value("effects.skin.lowpass", 0),
-                "distortion": self._get_config_value("effects.skin.distortion", 0),
-                "reverb": self._get_config_value("effects.skin.reverb", 0),
-                "echo": self._get_config_value("effects.skin.echo", 0),
-                "vocoder": self._get_config_value("effects.skin.vocoder", 0),
-                "hash": self._get_config_value("effects.skin.hash", 0),
-                "dry_wet": self._get_config_value("effects.skin.dry_wet", 100)
-            }
+            # Paramètres skin depuis la configuration (relus seulement après un changement)
+            skin_cfg = self._skin_cfg
+            if skin_cfg is None:
+                skin_cfg = self._skin_cfg = self._load_skin_cfg()
+            skin_params = skin_cfg.copy()
             
             print(f"🎛️ Paramètres skin extraits de la config: {skin_params}")
             
@@ -22,7 +22,7 @@ from core.lexique.manager import get_lexique_manager
 import queue  # Pour les exceptions queue.Empty
 import signal
 import sys
-from core.pol import create_pol
+from core.pol import create_pol, set_disabled_levels
 pol = create_pol(source_id=1)
 
 # ✅ Variables globales
@@ -174,7 +174,7 @@ def on_bus_message(msg):
         pol.write(1, "🎛️ Demande génération effet via bus...", "log")
         
         # Lazy import pour éviter les dépendances circulaires
-        from core.sound.fx_generator import fx_generator
+        from core.sound.fx_generator import get_fx_generator
         
         # Extraire les paramètres
         source_path = payload.get("source_path", "")
@@ -184,19 +184,13 @@ def on_bus_message(msg):
         requester = payload.get("requester", "unknown")
         
         # Convertir priorité string → enum
-        from core.sound.fx_generator import Priority
-        priority_map = {
-            "low": Priority.LOW,
-            "normal": Priority.NORMAL, 
-            "high": Priority.HIGH,
-            "urgent": Priority.URGENT
-        }
-        priority = priority_map.get(priority_str, Priority.NORMAL)
+        from core.sound.fx_generator import Priority, priority_from_str
+        priority = priority_from_str(priority_str, Priority.NORMAL)
         
         pol.write(1, f"🎛️ Génération effet {effect_type} (priorité: {priority_str}, source: {requester})", "log")
 
         # Déclencher génération asynchrone
-        success = fx_generator.create_async(source_path, effect_type, force_remake, priority)
+        success = get_fx_generator().create_async(source_path, effect_type, force_remake, priority)
         
         if success:
             pol.write(1, f"✅ Effet {effect_type} programmé", "log")
@@ -207,7 +201,7 @@ def on_bus_message(msg):
         pol.write(1, "🎛️ Demande génération toutes variantes via bus...", "log")
         
         # Lazy import pour éviter les dépendances circulaires
-        from core.sound.fx_generator import fx_generator, Priority
+        from core.sound.fx_generator import get_fx_generator, priority_from_str, Priority
         
         # Extraire les paramètres
         source_path = payload.get("source_path", "")
@@ -217,21 +211,12 @@ def on_bus_message(msg):
         requester = payload.get("requester", "unknown")
         
         # Convertir priorité
-        priority_map = {
-            "low": Priority.LOW,
-            "normal": Priority.NORMAL,
-            "high": Priority.HIGH, 
-            "urgent": Priority.URGENT
-        }
-        priority = priority_map.get(priority_str, Priority.LOW)
+        priority = priority_from_str(priority_str, Priority.LOW)
         
         pol.write(1, f"🎛️ Génération toutes variantes {effects} (priorité: {priority_str}, source: {requester})", "log")
 
-        # Programmer chaque effet
-        programmed = 0
-        for effect in effects:
-            if fx_generator.create_async(source_path, effect, force_remake, priority):
-                programmed += 1
+        # Programmer tous les effets en un seul passage
+        programmed = get_fx_generator().create_async_batch(source_path, effects, force_remake, priority)
 
         pol.write(1, f"✅ {programmed}/{len(effects)} variantes programmées", "log")
 
@@ -300,6 +285,9 @@ def main():
     # ✅ Créer le gestionnaire de configuration et l'assigner à la variable globale
     config = get_config_manager(bus)
     
+    # ✅ Niveaux de log désactivés par module (traces des chemins chauds)
+    set_disabled_levels(config.get("log.disabled_levels", {}))
+    
     # ✅ Passer config au lexique pour hotword
     lexique.set_config_manager(config)
     
@@ -545,8 +545,8 @@ class VoiceEffectsProcessor:
         modulator = np.sin(2 * np.pi * mod_freq * t)
         
         result = data.copy()
-        for ch in range(data.shape[1]):
-            result[:, ch] *= (1 + (intensity / 100.0) * modulator * 0.5)
+        # Même modulateur pour tous les canaux : diffusé sur l'axe des canaux, en place
+        result *= (1 + (intensity / 100.0) * modulator * 0.5)[:, np.newaxis]
         
         return result
     
@@ -658,10 +658,8 @@ class VoiceEffectsProcessor:
         for delay in delays:
             delay_samples = int(delay * self.sample_rate)
             if delay_samples < len(data):
-                for ch in range(data.shape[1]):
-                    delayed = np.zeros_like(data[:, ch])
-                    delayed[delay_samples:] = data[:-delay_samples, ch] * decay
-                    result[:, ch] += delayed
+                # Tous les canaux d'un coup, accumulé en place (pas de buffer retardé intermédiaire)
+                result[delay_samples:] += data[:-delay_samples] * decay
         
         return result
     
@@ -678,51 +676,45 @@ class VoiceEffectsProcessor:
             return data
         
         result = data.copy()
-        for ch in range(data.shape[1]):
-            echo = np.zeros_like(data[:, ch])
-            echo[delay_samples:] = data[:-delay_samples, ch] * feedback
-            result[:, ch] += echo
+        # Tous les canaux d'un coup, accumulé en place (pas de buffer d'écho intermédiaire)
+        result[delay_samples:] += data[:-delay_samples] * feedback
         
         return result
     
     def _apply_bandpass_filter(self, data: np.ndarray, low_freq: float, high_freq: float) -> np.ndarray:
         """Filtre passe-bande simple (numpy)"""
-        result = data.copy()
+        n = len(data)
         
-        for ch in range(data.shape[1]):
-            fft_data = np.fft.rfft(result[:, ch])
-            freqs = np.fft.rfftfreq(len(result[:, ch]), 1/self.sample_rate)
-            
-            mask = np.ones_like(freqs)
-            low_mask = freqs < low_freq
-            high_mask = freqs > high_freq
-            
-            if np.any(low_mask):
-                mask[low_mask] *= np.maximum(0.1, freqs[low_mask] / low_freq)
-            if np.any(high_mask):
-                mask[high_mask] *= np.maximum(0.1, high_freq / freqs[high_mask])
-            
-            result[:, ch] = np.fft.irfft(fft_data * mask, len(result[:, ch]))
+        # Masque calculé une fois, FFT de tous les canaux en un seul appel (axe 0)
+        freqs = np.fft.rfftfreq(n, 1/self.sample_rate)
+        mask = np.ones_like(freqs)
+        low_mask = freqs < low_freq
+        high_mask = freqs > high_freq
         
-        return result
+        if np.any(low_mask):
+            mask[low_mask] *= np.maximum(0.1, freqs[low_mask] / low_freq)
+        if np.any(high_mask):
+            mask[high_mask] *= np.maximum(0.1, high_freq / freqs[high_mask])
+        
+        fft_data = np.fft.rfft(data, axis=0)
+        fft_data *= mask[:, np.newaxis]
+        return np.fft.irfft(fft_data, n, axis=0).astype(data.dtype, copy=False)
     
     def _apply_lowpass_filter(self, data: np.ndarray, cutoff_freq: float) -> np.ndarray:
         """Filtre passe-bas simple (numpy)"""
-        result = data.copy()
-        
-        for ch in range(data.shape[1]):
-            fft_data = np.fft.rfft(result[:, ch])
-            freqs = np.fft.rfftfreq(len(result[:, ch]), 1/self.sample_rate)
-            
-            mask = np.ones_like(freqs)
-            high_mask = freqs > cutoff_freq
-            if np.any(high_mask):
-                rolloff = np.exp(-(freqs[high_mask] - cutoff_freq) / (cutoff_freq * 0.4))
-                mask[high_mask] = rolloff * 0.2
-            
-            result[:, ch] = np.fft.irfft(fft_data * mask, len(result[:, ch]))
-        
-        return result
+        n = len(data)
+        
+        # Masque calculé une fois, FFT de tous les canaux en un seul appel (axe 0)
+        freqs = np.fft.rfftfreq(n, 1/self.sample_rate)
+        mask = np.ones_like(freqs)
+        high_mask = freqs > cutoff_freq
+        if np.any(high_mask):
+            rolloff = np.exp(-(freqs[high_mask] - cutoff_freq) / (cutoff_freq * 0.4))
+            mask[high_mask] = rolloff * 0.2
+        
+        fft_data = np.fft.rfft(data, axis=0)
+        fft_data *= mask[:, np.newaxis]
+        return np.fft.irfft(fft_data, n, axis=0).astype(data.dtype, copy=False)
     
     def _normalize(self, data: np.ndarray) -> np.ndarray:
         """Normalise l'audio pour éviter le clipping"""